@@ -0,0 +1,458 @@
+"""
+여러 달 집계 - 근무월별 파싱 결과를 캐시하고 월/주/연 단위 합계와 한도 확인
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import profiler
+import roster
+from filecache import FileCache
+
+logger = logging.getLogger(__name__)
+
+# 주휴수당: 1주 소정근로시간이 15시간 이상이면 대상
+WEEKLY_HOLIDAY_PAY_HOURS = 15
+
+# 메모리에 보관할 근무월 수 (한 해 + 여유분)
+MONTH_CACHE_SIZE = 24
+
+# 스캔 결과 디스크 캐시 용량 제한 (넘으면 가장 오래 안 쓴 것부터 삭제)
+# CSV는 스캔 결과와 (경로, 수정시각, 크기) 연결 항목, 두 개씩 저장
+ROSTER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+ROSTER_CACHE_MAX_ENTRIES = 96
+
+# 스캔 결과 형식이 바뀌면 올려서 이전 디스크 캐시를 무시
+ROSTER_CACHE_VERSION = 2
+
+# 그래프 막대 수 제한 - 근무일이 이보다 많으면 주 단위, 주가 이보다 많으면 월 단위
+CHART_MAX_DAYS = 62
+CHART_MAX_WEEKS = 26
+
+
+def source_key(source):
+    """원본 구분값 - CSV는 파일 경로, 시트 행 목록은 근무월로만 구분"""
+    if isinstance(source, str):
+        return ("csv", os.path.abspath(source))
+    return ("rows",)
+
+
+def source_fingerprint(source):
+    """원본 내용 식별값 - CSV는 수정시각/크기, 시트 행 목록은 내용 해시"""
+    if isinstance(source, str):
+        stat = os.stat(source)
+        return (stat.st_mtime_ns, stat.st_size)
+    payload = json.dumps(source, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def content_digest():
+    """디스크 캐시 키용 해시 객체 (스트리밍 파싱 중에 읽은 바이트를 넣음)"""
+    return hashlib.sha256(f"v{ROSTER_CACHE_VERSION}\0".encode("ascii"))
+
+
+def content_hash(data):
+    """원본 내용 해시 (디스크 캐시 키) - CSV는 파일 내용(bytes), 시트 행 목록은 값 자체
+
+    구글 시트 행 목록은 시트 리비전이 같으면 gsheet 캐시에서 같은 값이 오므로
+    값의 해시가 곧 리비전 구분값
+    """
+    digest = content_digest()
+    if isinstance(data, bytes):
+        digest.update(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def file_key(path, fingerprint):
+    """CSV 연결 항목 키 - 경로와 수정시각/크기 (파일을 읽지 않고 디스크 캐시 조회)"""
+    mtime_ns, size = fingerprint
+    text = f"v{ROSTER_CACHE_VERSION}\0{os.path.abspath(path)}\0{mtime_ns}\0{size}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RosterDiskCache(FileCache):
+    """스캔 결과(시간 헤더 + 이름 역색인) 디스크 캐시 - 내용 해시별 pickle 파일
+
+    프로그램을 다시 켜도 같은 CSV/시트는 read_csv와 파싱 없이 바로 사용
+    """
+
+    folder = "rosters"
+    suffix = ".pickle"
+    binary = True
+
+    def __init__(self, directory=None, max_bytes=None, max_entries=None):
+        super().__init__(
+            directory,
+            max_bytes or ROSTER_CACHE_MAX_BYTES,
+            max_entries or ROSTER_CACHE_MAX_ENTRIES,
+        )
+
+    def dump(self, entry, f):
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, f):
+        return pickle.load(f)
+
+    def get(self, key):
+        """캐시 항목 읽기 - 없거나 깨졌으면 None"""
+        entry = self.read(key)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        return entry
+
+    def put(self, key, time_headers, index, blocks):
+        """캐시 항목 저장"""
+        self.write(
+            key,
+            {
+                "key": key,
+                "time_headers": time_headers,
+                "index": index,
+                "blocks": blocks,
+            },
+        )
+
+    def link(self, alias, key):
+        """다른 키(file_key)로도 key 항목을 찾을 수 있게 연결 항목 저장"""
+        self.write(alias, {"key": alias, "target": key})
+
+    def get_linked(self, alias):
+        """연결 항목을 따라가 캐시 항목 읽기 - (항목, 내용 키) 또는 (None, None)"""
+        link = self.get(alias)
+        if link is None or "target" not in link:
+            return None, None
+        entry = self.get(link["target"])
+        if entry is None:
+            return None, None
+        return entry, link["target"]
+
+
+class MonthCache:
+    """근무월별 스캔 결과(시간 헤더 + 이름 역색인) 캐시
+
+    달을 하나 추가하거나 이름만 바꿔 다시 조회할 때 이미 읽은 시트는 다시 파싱하지 않음
+    같은 파일이 수정되면 내용이 바뀐 헤더 블록만 다시 파싱 (roster.build_block_index)
+    roster.STREAM_MIN_BYTES 이상의 CSV는 스트리밍 파싱 (roster.stream_name_index)
+    disk(RosterDiskCache)가 있으면 메모리에 없는 달은 디스크에서 먼저 찾음 - CSV는
+    수정시각/크기로 먼저 찾고, 없으면 파싱할 때 읽는 바이트로 내용 해시를 계산해서
+    파일을 두 번 읽지 않음
+    """
+
+    def __init__(self, max_months=MONTH_CACHE_SIZE, disk=None):
+        self.max_months = max_months
+        self.disk = disk
+        self.months = OrderedDict()
+        self._lock = threading.Lock()  # 작업 스레드 여러 개가 함께 조회할 수 있음
+
+    def month(self, month_range, source, year=None, timer=None):
+        """근무월 하나의 스캔 결과 - {month_range, year, time_headers, index, ...}
+
+        rescanned: 이번 조회에서 다시 파싱한 헤더 블록 수 (캐시 그대로면 0)
+        timer의 취소 토큰으로 중간에 멈추면 캐시는 이전 상태 그대로
+        """
+        # 연도 없음 = 올해 (scan_sheets가 연도를 넣어 조회한 항목과 같은 캐시 사용)
+        year = year or datetime.now().year
+        with self._lock:
+            return self._month(month_range, source, year, timer)
+
+    def _month(self, month_range, source, year, timer):
+        key = (month_range, year, source_key(source))
+        fingerprint = source_fingerprint(source)
+        cached = self.months.get(key)
+        if cached is not None:
+            self.months.move_to_end(key)
+            if cached["fingerprint"] == fingerprint:
+                cached["rescanned"] = 0
+                return cached
+
+        # 메모리에 없으면 디스크 캐시 (수정된 파일은 바뀐 블록만 다시 파싱하는 편이 빠름)
+        disk_key = data = None
+        if self.disk is not None:
+            with profiler.stage(timer, "cache_read") as record:
+                entry, disk_key, data = self.disk_lookup(
+                    source, fingerprint, cached is None
+                )
+                record["items"] = 0 if entry is None else len(entry["index"])
+            if entry is not None:
+                return self.store(
+                    key,
+                    month_range,
+                    year,
+                    fingerprint,
+                    entry["time_headers"],
+                    entry["index"],
+                    entry["blocks"],
+                    0,
+                )
+
+        if roster.is_large_csv(source):
+            # 아주 큰 CSV는 DataFrame 없이 한 줄씩 읽음 (블록 단위 재사용 없음)
+            digest = None if self.disk is None else content_digest()
+            with profiler.stage(timer, "name_scan") as record:
+                time_headers, index = roster.stream_name_index(
+                    source, timer.advance if timer else None, digest
+                )
+                record["items"] = sum(len(slots) for slots in index.values())
+            blocks, rescanned = {}, len(time_headers)
+            if digest is not None:
+                disk_key = digest.hexdigest()
+        else:
+            with profiler.stage(timer, "csv_read") as record:
+                if data is None:
+                    df = roster.load_roster(source)
+                else:
+                    df = roster.read_roster(io.BytesIO(data))
+                record["items"] = len(df)
+            with profiler.stage(timer, "headers") as record:
+                time_headers = roster.find_time_headers(df)
+                record["items"] = len(time_headers)
+            with profiler.stage(timer, "name_scan") as record:
+                index, blocks, rescanned = roster.build_block_index(
+                    df,
+                    time_headers,
+                    cached["blocks"] if cached else None,
+                    timer.advance if timer else None,
+                )
+                record["items"] = sum(len(slots) for slots in index.values())
+
+        if disk_key is not None:
+            try:
+                self.disk.put(disk_key, time_headers, index, blocks)
+                if isinstance(source, str):
+                    self.disk.link(file_key(source, fingerprint), disk_key)
+            except OSError as e:
+                # 캐시 저장 실패는 무시 (다음에 다시 파싱)
+                logger.warning("스캔 캐시 저장 실패: %s", e)
+
+        return self.store(
+            key, month_range, year, fingerprint, time_headers, index, blocks, rescanned
+        )
+
+    def disk_lookup(self, source, fingerprint, lookup):
+        """디스크 캐시 조회 - (항목 또는 None, 내용 키, 읽은 CSV 바이트)
+
+        lookup이 거짓이면(메모리에 이전 결과가 있어 블록 단위로 다시 파싱) 키만 계산
+        CSV는 연결 항목(file_key)을 먼저 보고, 없으면 파일을 한 번 읽어 내용 해시로
+        조회한 뒤 읽은 바이트를 그대로 파싱에 넘김. 스트리밍할 큰 CSV는 파싱하면서
+        해시를 계산하므로 내용 키는 None
+        """
+        if not isinstance(source, str):
+            disk_key = content_hash(source)
+            return (self.disk.get(disk_key) if lookup else None), disk_key, None
+
+        if lookup:
+            entry, disk_key = self.disk.get_linked(file_key(source, fingerprint))
+            if entry is not None:
+                return entry, disk_key, None
+        if roster.is_large_csv(source):
+            return None, None, None
+
+        with open(source, "rb") as f:
+            data = f.read()
+        disk_key = content_hash(data)
+        entry = self.disk.get(disk_key) if lookup else None
+        if entry is not None:
+            # 내용은 같고 수정시각만 바뀐 파일 - 다음에는 읽지 않고 찾도록 연결
+            try:
+                self.disk.link(file_key(source, fingerprint), disk_key)
+            except OSError as e:
+                logger.warning("스캔 캐시 저장 실패: %s", e)
+        return entry, disk_key, data
+
+    def store(
+        self,
+        key,
+        month_range,
+        year,
+        fingerprint,
+        time_headers,
+        index,
+        blocks,
+        rescanned,
+    ):
+        """스캔 결과를 메모리 캐시에 넣고 반환 (오래된 달부터 제거)"""
+        scanned = {
+            "month_range": month_range,
+            "year": year,
+            "time_headers": time_headers,
+            "index": index,
+            "fingerprint": fingerprint,
+            "blocks": blocks,
+            "rescanned": rescanned,
+        }
+        self.months[key] = scanned
+        while len(self.months) > self.max_months:
+            self.months.popitem(last=False)
+        return scanned
+
+    def clear(self):
+        self.months.clear()
+
+
+_cache = MonthCache(disk=RosterDiskCache())
+
+
+def get_cache():
+    """프로세스 전체에서 공유하는 근무월 캐시"""
+    return _cache
+
+
+def month_parsed(scanned, target_name, timer=None):
+    """스캔 결과에서 한 사람의 중간 결과 (없으면 None)"""
+    work_data = roster.lookup_work_data(
+        scanned["index"], scanned["time_headers"], target_name
+    )
+    if not work_data:
+        return None
+    return roster.build_parsed(
+        work_data, target_name, scanned["month_range"], scanned["year"], timer
+    )
+
+
+def scan_sheets(sheets, cache=None, timer=None):
+    """{근무월: 원본}의 각 달 스캔 결과 목록 (연도는 달 순서로 추정)"""
+    cache = cache or _cache
+    years = roster.sheet_years(list(sheets))
+    return [
+        cache.month(month_range, source, year, timer)
+        for (month_range, source), year in zip(sheets.items(), years)
+    ]
+
+
+def parse_sheets(sheets, target_name, cache=None, timer=None):
+    """여러 달 워크시트/CSV {근무월: 원본}에서 한 사람의 근무를 합친 중간 결과"""
+    parsed_list = []
+    for scanned in scan_sheets(sheets, cache, timer):
+        parsed = month_parsed(scanned, target_name, timer)
+        if parsed is not None:
+            parsed_list.append(parsed)
+
+    if not parsed_list:
+        return None
+    return roster.combine_parsed(parsed_list)
+
+
+def parse_all_sheets(sheets, cache=None, timer=None):
+    """여러 달 워크시트/CSV에서 전체 근무자 일괄 파싱 - {이름: 합친 중간 결과}"""
+    parsed_lists = {}
+    for scanned in scan_sheets(sheets, cache, timer):
+        for name in scanned["index"]:
+            work_data = roster.lookup_work_data(
+                {name: scanned["index"][name]}, scanned["time_headers"], name
+            )
+            parsed_lists.setdefault(name, []).append(
+                roster.build_parsed(
+                    work_data, name, scanned["month_range"], scanned["year"], timer
+                )
+            )
+
+    return {
+        name: roster.combine_parsed(parsed_lists[name]) for name in sorted(parsed_lists)
+    }
+
+
+def daily_minutes(parsed):
+    """실제 날짜별 근무 분 - {datetime.date: 분} (날짜순)"""
+    minutes = {}
+    for work_date in parsed["date_order"]:
+        real_date = parsed["dates"][work_date]
+        minutes[real_date] = minutes.get(real_date, 0) + roster.day_minutes(
+            parsed["merged"][work_date]
+        )
+    return dict(sorted(minutes.items()))
+
+
+def summarize(parsed, annual_cap_hours=None):
+    """월/주/연 단위 합계와 주휴수당·연간 한도 확인
+
+    반환값:
+        per_month: {"2025년 8월": 시간}
+        per_week: [{start, end, hours, holiday_pay, partial}] (월요일 시작)
+        per_year: {연도: 시간}
+        holiday_pay_weeks: 주휴수당 대상 주 수
+        warnings: 한도 초과 안내 문구 목록
+    partial: 주의 일부가 조회 기간 밖이라 합계가 모자랄 수 있는 주
+    """
+    days = daily_minutes(parsed)
+    per_month = {}
+    per_year = {}
+    weeks = {}
+    for real_date, minutes in days.items():
+        month_key = f"{real_date.year}년 {real_date.month}월"
+        per_month[month_key] = per_month.get(month_key, 0) + minutes
+        per_year[real_date.year] = per_year.get(real_date.year, 0) + minutes
+        week_start = real_date - timedelta(days=real_date.weekday())
+        weeks[week_start] = weeks.get(week_start, 0) + minutes
+
+    first = min(days) if days else None
+    last = max(days) if days else None
+    per_week = []
+    for week_start, minutes in sorted(weeks.items()):
+        week_end = week_start + timedelta(days=6)
+        hours = minutes / 60
+        per_week.append(
+            {
+                "start": week_start,
+                "end": week_end,
+                "hours": hours,
+                "holiday_pay": hours >= WEEKLY_HOLIDAY_PAY_HOURS,
+                "partial": week_start < first or week_end > last,
+            }
+        )
+
+    warnings = []
+    if annual_cap_hours:
+        for year, minutes in per_year.items():
+            if minutes / 60 > annual_cap_hours:
+                warnings.append(
+                    f"{year}년 근무시간 {minutes / 60:.2f}시간이 "
+                    f"연간 한도 {annual_cap_hours:g}시간을 넘었습니다."
+                )
+
+    return {
+        "per_month": {key: minutes / 60 for key, minutes in per_month.items()},
+        "per_week": per_week,
+        "per_year": {year: minutes / 60 for year, minutes in per_year.items()},
+        "holiday_pay_weeks": sum(week["holiday_pay"] for week in per_week),
+        "warnings": warnings,
+    }
+
+
+def chart_series(stats, max_days=CHART_MAX_DAYS, max_weeks=CHART_MAX_WEEKS):
+    """그래프 막대 목록 - 기간이 길면 주/월 단위로 합쳐 막대 수를 제한
+
+    반환값: {unit: "day"/"week"/"month", labels, hours}
+    """
+    parsed = stats.get("parsed")
+    if stats["days"] <= max_days or parsed is None:
+        return {
+            "unit": "day",
+            "labels": stats.get("day_labels", stats["day_list"]),
+            "hours": stats["hours_list"],
+        }
+
+    summary = summarize(parsed)
+    weeks = summary["per_week"]
+    if len(weeks) <= max_weeks:
+        return {
+            "unit": "week",
+            "labels": [f"{week['start'].month}/{week['start'].day}~" for week in weeks],
+            "hours": [round(week["hours"], 2) for week in weeks],
+        }
+
+    months = summary["per_month"]
+    return {
+        "unit": "month",
+        "labels": list(months),
+        "hours": [round(hours, 2) for hours in months.values()],
+    }
@@ -0,0 +1,303 @@
+"""
+성능 측정 스크립트
+
+    python bench.py startup            # 첫 화면(page 1)이 뜨기까지 걸리는 시간
+    python bench.py startup --runs 10
+    python bench.py roster             # 가상 근무표 크기별 파싱/병합/엑셀/그래프 시간
+    python bench.py roster --rows 12000 --slots 24 --workers 80
+    python bench.py roster --save bench.json            # 결과 저장
+    python bench.py roster --baseline bench.json        # 저장한 결과와 비교
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 첫 화면 전에 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ["pandas", "matplotlib", "gspread", "google.oauth2", "openpyxl"]
+
+# 자식 프로세스에서 실행: 창을 띄우고 이벤트 루프가 처음 돌 때(첫 페인트) 보고
+STARTUP_SNIPPET = """
+import sys
+from PyQt5.QtCore import QTimer
+import gui
+
+app = gui.QApplication(sys.argv)
+window = gui.ScheduleApp()
+window.show()
+
+def painted():
+    heavy = [m for m in {heavy!r} if m in sys.modules]
+    print("READY " + ",".join(heavy), flush=True)
+    app.quit()
+
+QTimer.singleShot(0, painted)
+app.exec_()
+"""
+
+
+def measure_startup():
+    """프로세스 시작부터 첫 화면까지 걸린 시간(초)과 미리 불러온 무거운 모듈"""
+    snippet = STARTUP_SNIPPET.format(heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", snippet],
+        cwd=HERE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    heavy = []
+    for line in proc.stdout:
+        if line.startswith("READY"):
+            elapsed = time.perf_counter() - start
+            heavy = [m for m in line[len("READY") :].strip().split(",") if m]
+            break
+    else:
+        raise RuntimeError("GUI가 시작되지 않았습니다.")
+    proc.wait()
+    return elapsed, heavy
+
+
+def run_startup(args):
+    """startup: 첫 화면 시간 여러 번 측정 후 요약"""
+    times = []
+    heavy = []
+    for _ in range(args.runs):
+        elapsed, heavy = measure_startup()
+        times.append(elapsed)
+
+    print(
+        f"startup: median {statistics.median(times):.3f}s, "
+        f"min {min(times):.3f}s, max {max(times):.3f}s ({args.runs}회)"
+    )
+    if heavy:
+        print(f"경고: 첫 화면 전에 불러온 모듈 - {', '.join(heavy)}")
+        return 1
+    return 0
+
+
+# 가상 근무표 기본 크기와 축별로 늘려 볼 크기 (행 수, 시간 칸 수, 근무자 수)
+BASE_SCALE = {"rows": 600, "slots": 12, "workers": 20}
+SCALE_STEPS = {
+    "rows": [600, 3000, 12000],
+    "slots": [6, 12, 24],
+    "workers": [5, 20, 80],
+}
+
+# 한 주(헤더 블록)에 들어가는 날 수, 근무 기간 첫날 (21일 ~ 다음 달 20일)
+DAYS_PER_BLOCK = 7
+FIRST_DAY = 21
+PERIOD_DAYS = 31
+BENCH_MONTH = "8-9"
+
+# 측정 단계 (profiler 단계 이름) - 파싱/병합/엑셀/그래프
+BENCH_STAGES = [
+    "csv_read",
+    "headers",
+    "name_scan",
+    "merge",
+    "calendar",
+    "excel",
+    "chart",
+]
+
+# 저장한 결과보다 이 배수 이상 느려지면 성능 저하로 판단
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_SECONDS = 0.01  # 이보다 작은 차이는 측정 오차로 봄
+
+
+def generate_roster(path, rows, slots, workers, seed=0):
+    """roster 파싱 엔진이 읽는 형식의 가상 근무표 CSV 생성
+
+    - 헤더 행: A/B 열은 비우고 "HH:MM~HH:MM" 시간 칸
+    - 날짜 행: A 열 "N일" (다음 행들은 같은 날의 다른 조), B 열 조 이름
+    - 칸마다 근무자 이름 또는 빈칸
+    rows가 근무 기간(31일)보다 많으면 하루에 여러 조로 나눔
+    """
+    rng = random.Random(seed)
+    names = [f"근무자{i:03d}" for i in range(workers)]
+    cells = names + [""] * max(1, workers // 4)  # 빈칸도 섞음
+    slot_headers = [
+        f"{(8 * 60 + 30 * i) // 60 % 24:02d}:{30 * (i % 2):02d}~"
+        f"{(8 * 60 + 30 * (i + 1)) // 60 % 24:02d}:{30 * ((i + 1) % 2):02d}"
+        for i in range(slots)
+    ]
+    shifts = max(1, -(-rows // PERIOD_DAYS))
+    days = [
+        (FIRST_DAY - 1 + i) % 31 + 1
+        for i in range(min(PERIOD_DAYS, -(-rows // shifts)))
+    ]
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for block in range(0, len(days), DAYS_PER_BLOCK):
+            writer.writerow(["", ""] + slot_headers)
+            for day in days[block : block + DAYS_PER_BLOCK]:
+                for shift in range(shifts):
+                    writer.writerow(
+                        [f"{day}일" if shift == 0 else "", f"{shift + 1}조"]
+                        + [rng.choice(cells) for _ in slot_headers]
+                    )
+    return path
+
+
+def bench_scales(args):
+    """측정할 크기 목록 - 인자로 지정하면 그 하나, 아니면 축별로 하나씩 늘림"""
+    if args.rows or args.slots or args.workers:
+        return [
+            {
+                "rows": args.rows or BASE_SCALE["rows"],
+                "slots": args.slots or BASE_SCALE["slots"],
+                "workers": args.workers or BASE_SCALE["workers"],
+            }
+        ]
+
+    scales = []
+    for axis, values in SCALE_STEPS.items():
+        for value in values:
+            scale = dict(BASE_SCALE, **{axis: value})
+            if scale not in scales:
+                scales.append(scale)
+    return scales
+
+
+def scale_key(scale):
+    return f"rows={scale['rows']} slots={scale['slots']} workers={scale['workers']}"
+
+
+def chart_window():
+    """그래프 측정용 창 (화면 없이 그리기)"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # 한글 글꼴이 없는 환경의 글리프 경고는 측정과 무관
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    import gui
+
+    app = gui.QApplication.instance() or gui.QApplication(sys.argv)
+    return app, gui.ScheduleApp()
+
+
+def measure_roster(path, out_dir, window):
+    """근무표 하나를 전체 과정으로 처리하며 단계별 시간(초) 측정"""
+    import aggregate
+    import export
+    import profiler
+    import roster
+
+    # 매번 새 캐시로 - 이전 측정의 스캔 결과를 재사용하지 않게
+    timer = profiler.StageTimer(BENCH_STAGES, label=os.path.basename(path))
+    parsed_by_name = aggregate.parse_all_sheets(
+        {BENCH_MONTH: path}, cache=aggregate.MonthCache(), timer=timer
+    )
+    with timer.stage("excel", len(parsed_by_name)):
+        export.save_all(parsed_by_name, out_dir)
+
+    if window is not None:
+        # 근무일이 가장 많은 사람의 그래프
+        busiest = max(parsed_by_name.values(), key=lambda p: len(p["date_order"]))
+        stats = roster.build_stats(busiest)
+        with timer.stage("chart", len(stats["hours_list"])):
+            window.create_chart(stats)
+            window.canvas.draw()  # draw_idle로 예약된 그리기까지 측정
+
+    return {entry["stage"]: entry["seconds"] for entry in timer.summary()["stages"]}
+
+
+def run_roster(args):
+    """roster: 가상 근무표 크기별 단계 시간 측정 (중앙값)"""
+    window = None
+    if not args.no_chart:
+        app, window = chart_window()  # noqa: F841 - 창이 살아 있는 동안 앱 유지
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for scale in bench_scales(args):
+            path = generate_roster(
+                os.path.join(work_dir, f"{BENCH_MONTH}.csv"), seed=args.seed, **scale
+            )
+            runs = [
+                measure_roster(path, os.path.join(work_dir, "out"), window)
+                for _ in range(args.runs)
+            ]
+            stages = {
+                name: statistics.median(run[name] for run in runs)
+                for name in BENCH_STAGES
+                if name in runs[0]
+            }
+            results[scale_key(scale)] = stages
+            print(
+                f"{scale_key(scale)}: "
+                + ", ".join(
+                    f"{name} {seconds:.3f}s" for name, seconds in stages.items()
+                )
+            )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        return compare_results(results, args.baseline)
+    return 0
+
+
+def compare_results(results, baseline_path):
+    """저장한 결과와 비교 - REGRESSION_RATIO배 이상 느려진 단계가 있으면 1"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    slower = []
+    for key, stages in results.items():
+        for name, seconds in stages.items():
+            before = baseline.get(key, {}).get(name)
+            if (
+                before
+                and seconds > before * REGRESSION_RATIO
+                and seconds - before > REGRESSION_MIN_SECONDS
+            ):
+                slower.append(f"{key} {name}: {before:.3f}s → {seconds:.3f}s")
+
+    if slower:
+        print("경고: 느려진 단계")
+        for line in slower:
+            print(f"  {line}")
+        return 1
+    print(f"비교 완료: {baseline_path}보다 {REGRESSION_RATIO}배 이상 느려진 단계 없음")
+    return 0
+
+
+def main(argv=None):
+    """벤치마크 진입점"""
+    parser = argparse.ArgumentParser(description="근무시간 병합기 성능 측정")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    startup = sub.add_parser("startup", help="첫 화면까지 걸리는 시간")
+    startup.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    startup.set_defaults(func=run_startup)
+
+    roster = sub.add_parser("roster", help="가상 근무표 크기별 단계 시간")
+    roster.add_argument("--rows", type=int, help="날짜 행 수")
+    roster.add_argument("--slots", type=int, help="시간 칸 수")
+    roster.add_argument("--workers", type=int, help="근무자 수")
+    roster.add_argument("--runs", type=int, default=3, help="크기별 측정 횟수")
+    roster.add_argument("--seed", type=int, default=0, help="근무표 생성 시드")
+    roster.add_argument("--no-chart", action="store_true", help="그래프 측정 생략")
+    roster.add_argument("--save", help="결과를 JSON으로 저장")
+    roster.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    roster.set_defaults(func=run_roster)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""
+작업 취소 - 스레드를 강제로 끝내지 않고 작업이 확인 지점에서 스스로 멈추게 함
+
+    token = CancelToken()
+    ...                    # 작업 스레드: 청크/단계 사이마다 token.check()
+    token.cancel()         # GUI 스레드: 취소 요청 (바로 반환)
+
+QThread.terminate()는 파일 쓰기나 pandas 작업 중간에 스레드를 죽여서 반쯤 쓴
+파일이나 잠긴 상태가 남을 수 있음
+"""
+
+import threading
+
+
+class Cancelled(Exception):
+    """취소 요청으로 작업을 중단함"""
+
+
+class CancelToken:
+    """취소 요청 표시 - 여러 스레드에서 함께 확인해도 안전"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """취소됐으면 Cancelled 발생"""
+        if self._event.is_set():
+            raise Cancelled()
+
+
+def check(token):
+    """token이 없으면 아무것도 하지 않는 check (roster/gsheet에서 사용)"""
+    if token is not None:
+        token.check()
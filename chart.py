@@ -0,0 +1,101 @@
+"""
+페이지 2 일별 근무시간 그래프 - 축/막대/값 표시를 한 번 만들고 값만 바꿔서 다시 그림
+
+matplotlib을 쓰므로 gui에서는 그래프를 처음 그릴 때 불러옴
+"""
+
+from matplotlib.patches import Rectangle
+
+BAR_COLOR = "#4a90e2"
+BAR_WIDTH = 0.5
+
+# 막대 단위별 (제목, x축 이름) - aggregate.chart_series의 unit
+UNIT_TITLES = {
+    "day": ("일별 근무시간", "날짜"),
+    "week": ("주별 근무시간", "주 (월요일 시작)"),
+    "month": ("월별 근무시간", "월"),
+}
+
+# 정보가 잘리지 않도록 내부 여백 충분히 확보 (x축 날짜, 제목)
+MARGINS = {"left": 0.13, "right": 0.97, "bottom": 0.28, "top": 0.80}
+
+
+class HoursChart:
+    """근무시간 막대그래프 (일별, 기간이 길면 주별/월별)
+
+    근무자/근무 월을 바꿀 때 figure를 지우고 축을 다시 만들지 않고, 기존 막대의
+    높이와 라벨, 축 범위만 바꾼 뒤 draw_idle로 다시 그림. 날짜 수가 늘면 막대를
+    추가하고, 줄면 남는 막대는 숨겨 두었다가 다시 사용
+    기간이 길면 aggregate.chart_series가 주/월 단위로 합쳐서 막대 수가 제한됨
+    글꼴은 gui.ensure_chart에서 rcParams로 한 번만 지정
+    """
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = figure.add_subplot(111)
+        self.title = self.ax.set_title("", fontsize=14, pad=26)
+        self.ax.set_xlabel("", fontsize=12, labelpad=7)
+        self.set_unit("day")
+        self.ax.set_ylabel("근무시간(시간)", fontsize=12, labelpad=7)
+        self.ax.tick_params(axis="y", labelsize=9)
+        figure.subplots_adjust(**MARGINS)
+
+        self.bars = []  # 막대 (Rectangle)
+        self.labels = []  # 막대 위 "N.Nh" 표시
+
+    def ensure_bars(self, count):
+        """막대/값 표시를 count개 이상 준비"""
+        for i in range(len(self.bars), count):
+            bar = Rectangle((i - BAR_WIDTH / 2, 0), BAR_WIDTH, 0, color=BAR_COLOR)
+            self.ax.add_patch(bar)
+            self.bars.append(bar)
+            self.labels.append(
+                self.ax.text(
+                    i,
+                    0,
+                    "",
+                    ha="center",
+                    va="bottom",
+                    fontsize=8,
+                    color="#333",
+                    weight="bold",
+                )
+            )
+
+    def set_unit(self, unit):
+        """막대 단위(일/주/월)에 맞게 제목과 x축 이름 변경"""
+        self.unit = unit
+        title, xlabel = UNIT_TITLES[unit]
+        self.title.set_text(title)
+        self.ax.xaxis.label.set_text(xlabel)
+
+    def update(self, day_labels, hours, unit="day"):
+        """막대 높이, 값 표시, 날짜 라벨, 축 범위 갱신 후 다시 그리기 예약"""
+        if unit != self.unit:
+            self.set_unit(unit)
+        count = len(hours)
+        self.ensure_bars(count)
+        max_hours = max(hours) if hours else 0
+
+        for i, (bar, label) in enumerate(zip(self.bars, self.labels)):
+            shown = i < count
+            bar.set_visible(shown)
+            label.set_visible(shown)
+            if shown:
+                bar.set_height(hours[i])
+                label.set_position((i, hours[i] + max_hours * 0.01))
+                label.set_text(f"{hours[i]:.1f}h")
+
+        self.ax.set_xticks(range(count))
+        self.ax.set_xticklabels(day_labels, rotation=45, fontsize=9)
+        # matplotlib 자동 범위와 같게: 막대 양 끝에서 5% 여유
+        left, right = -BAR_WIDTH / 2, max(count - 1, 0) + BAR_WIDTH / 2
+        margin = (right - left) * 0.05
+        self.ax.set_xlim(left - margin, right + margin)
+        self.ax.set_ylim(0, max_hours * 1.1 or 1)
+        self.canvas.draw_idle()
+
+    def clear(self):
+        """그래프 비우기 (축은 유지)"""
+        self.update([], [])
@@ -0,0 +1,182 @@
+"""
+근무시간 병합기 CLI - GUI 없이 파싱과 엑셀 저장만 실행 (pandas/openpyxl만 사용)
+"""
+
+import argparse
+import logging
+import sys
+
+import aggregate
+import export
+import log
+import profiler
+import roster
+
+logger = logging.getLogger(__name__)
+
+# 단계별 시간 측정 대상 (--profile)
+PARSE_STAGES = ["csv_read", "headers", "name_scan", "merge", "calendar"]
+
+
+def build_parser():
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="근무시간 병합기 (헤드리스 모드)"
+    )
+    parser.add_argument(
+        "--log-level",
+        type=log.parse_level,
+        help="로그 레벨 (DEBUG, INFO, WARNING...) - 하위 명령 앞에 지정",
+    )
+    parser.add_argument("--log-file", help="회전 로그 파일 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    merge = sub.add_parser("merge", help="근무자 한 명의 엑셀 생성")
+    merge.add_argument("--name", required=True, help="근무자 이름 (예: 권혁준)")
+
+    batch = sub.add_parser("batch", help="시트의 전체 근무자 엑셀 생성")
+
+    for command in (merge, batch):
+        # 여러 달은 --month/--csv를 순서대로 반복 (예: --month 8-9 --csv 8.csv
+        # --month 9-10 --csv 9.csv)
+        command.add_argument(
+            "--month", required=True, action="append", help="근무 월 (예: 8-9)"
+        )
+        command.add_argument(
+            "--csv", required=True, action="append", help="근무표 CSV 파일 경로"
+        )
+        command.add_argument("--out", default="", help="엑셀 저장 폴더")
+        command.add_argument(
+            "--annual-cap", type=float, default=0, help="연간 근무 한도 (시간)"
+        )
+        command.add_argument(
+            "--profile",
+            help=f"단계별 소요 시간을 JSON Lines로 추가할 파일 ({profiler.PROFILE_ENV})",
+        )
+
+    watch = sub.add_parser("watch", help="폴더를 감시해 CSV가 바뀔 때마다 엑셀 생성")
+    watch.add_argument("--dir", required=True, help="감시할 폴더")
+    watch.add_argument(
+        "--month", help="파일 이름에 근무 월(예: 8-9)이 없을 때 사용할 근무 월"
+    )
+    watch.add_argument("--out", help="엑셀 저장 폴더 (기본: 감시 폴더)")
+    watch.add_argument(
+        "--jobs", type=int, default=None, help="엑셀 저장 프로세스 수 (기본: CPU 수)"
+    )
+    watch.add_argument(
+        "--debounce", type=float, default=None, help="연속 저장을 묶는 시간 (초)"
+    )
+    watch.add_argument(
+        "--poll", action="store_true", help="inotify 대신 주기적으로 폴더 훑기"
+    )
+
+    return parser
+
+
+def print_stats(name, stats):
+    """통계 한 줄 출력"""
+    print(
+        f"{name}: 총 근무일수 {stats['days']}일, "
+        f"총 근무시간 {stats['total_hours']:.2f}시간, "
+        f"평균 1일 근무시간 {stats['avg_hours']:.2f}시간"
+    )
+
+
+def sheets_from_args(args):
+    """--month/--csv 쌍을 {근무월: CSV 경로}로 묶기"""
+    if len(args.month) != len(args.csv):
+        raise ValueError("--month와 --csv는 같은 개수로 지정해야 합니다.")
+    return dict(zip(args.month, args.csv))
+
+
+def print_summary(parsed, annual_cap):
+    """월별 합계, 주휴수당 대상 주, 한도 경고 출력"""
+    summary = aggregate.summarize(parsed, annual_cap)
+    if len(summary["per_month"]) > 1:
+        for month, hours in summary["per_month"].items():
+            print(f"  {month}: {hours:.2f}시간")
+    print(
+        f"  주휴수당 대상(주 {aggregate.WEEKLY_HOLIDAY_PAY_HOURS}시간 이상): "
+        f"{summary['holiday_pay_weeks']}주 / {len(summary['per_week'])}주"
+    )
+    for warning in summary["warnings"]:
+        print(f"  경고: {warning}")
+
+
+def run_merge(args):
+    """merge: 근무자 한 명 처리 (여러 달이면 실제 날짜 기준으로 합침)"""
+    timer = profiler.StageTimer(PARSE_STAGES + ["excel"], label=args.name)
+    parsed = aggregate.parse_sheets(sheets_from_args(args), args.name, timer=timer)
+    if parsed is None:
+        print("입력한 이름이 CSV에 없습니다. 이름을 다시 확인하세요.", file=sys.stderr)
+        return 1
+
+    with timer.stage("excel", 1):
+        saved = export.save_all({args.name: parsed}, args.out)
+    timer.finish(args.profile)
+    print_stats(args.name, roster.build_stats(parsed))
+    print_summary(parsed, args.annual_cap)
+    print(f"저장 완료: {saved[0]}")
+    return 0
+
+
+def run_batch(args):
+    """batch: 시트 한 번 스캔으로 전체 근무자 처리"""
+    timer = profiler.StageTimer(PARSE_STAGES + ["excel"], label="batch")
+    parsed_by_name = aggregate.parse_all_sheets(sheets_from_args(args), timer=timer)
+    if not parsed_by_name:
+        print("CSV에서 근무자를 찾을 수 없습니다.", file=sys.stderr)
+        return 1
+
+    with timer.stage("excel", len(parsed_by_name)):
+        saved = export.save_all(parsed_by_name, args.out)
+    timer.finish(args.profile)
+    for name, parsed in parsed_by_name.items():
+        print_stats(name, roster.build_stats(parsed))
+        print_summary(parsed, args.annual_cap)
+    print(f"저장 완료: {len(saved)}개 파일")
+    return 0
+
+
+def run_watch(args):
+    """watch: 감시 폴더의 CSV가 바뀔 때마다 전체 근무자 엑셀 다시 생성 (Ctrl+C로 종료)"""
+    import watch
+
+    watcher = watch.Watcher(
+        args.dir,
+        month_range=args.month,
+        out_dir=args.out,
+        jobs=args.jobs,
+        debounce=watch.DEBOUNCE_SECONDS if args.debounce is None else args.debounce,
+        source=watch.open_source(args.dir, polling=args.poll),
+    )
+    print(f"감시 시작: {args.dir} (종료: Ctrl+C)")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("감시 종료")
+    return 0
+
+
+COMMANDS = {"merge": run_merge, "batch": run_batch, "watch": run_watch}
+
+
+def main(argv=None):
+    """CLI 진입점 - 종료 코드 반환"""
+    args = build_parser().parse_args(argv)
+    # watch는 생성 결과를 로그로 알리므로 기본 INFO
+    log.setup_logging(
+        args.log_level,
+        args.log_file,
+        default_level="INFO" if args.command == "watch" else log.DEFAULT_LEVEL,
+    )
+    try:
+        return COMMANDS[args.command](args)
+    except Exception as e:
+        logger.debug("처리 실패", exc_info=True)
+        print(f"데이터 처리 중 오류: {str(e)}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
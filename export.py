@@ -0,0 +1,148 @@
+"""
+엑셀 내보내기 - 파싱 결과(roster.parse_roster)로 근무시간 엑셀 파일 생성
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import roster
+
+logger = logging.getLogger(__name__)
+
+
+# 엑셀 표 머리글과 전체 글꼴
+EXCEL_COLUMNS = ["월", "일", "요일", "근무시간"]
+FONT_NAME = "굴림"
+FONT_SIZE = 11
+
+# 이 개수 이상이면 프로세스 풀로 나눠 저장 (적으면 프로세스 시작 비용이 더 큼)
+PARALLEL_MIN_FILES = 8
+
+
+def default_jobs():
+    """엑셀 저장 프로세스 수 - CPU 수 (최대 8)"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def export_pool(jobs=None):
+    """엑셀 저장용 프로세스 풀
+
+    GUI 작업 스레드에서 fork하면 Qt 상태가 복제되므로 spawn 방식 사용
+    (PyInstaller 실행 파일은 main.py의 freeze_support 필요)
+    """
+    return ProcessPoolExecutor(
+        max_workers=jobs or default_jobs(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def excel_file_name(parsed, out_dir=""):
+    """엑셀 파일 경로: {이름}_{근무월}.xlsx"""
+    return os.path.join(out_dir, f"{parsed['name']}_{parsed['month_range']}.xlsx")
+
+
+def write_workbook(records, file_name, columns=EXCEL_COLUMNS, progress=None):
+    """행 목록을 굴림 글꼴 엑셀로 저장 - 파일은 한 번만 씀
+
+    write_only 모드로 글꼴을 지정한 셀을 바로 기록 (다시 열어 셀마다 글꼴을
+    바꾸지 않음). 머리글은 pandas to_excel과 같은 얇은 테두리/가운데 정렬
+    progress(기록한 행 수, 전체 행 수)가 주어지면 행마다 호출 (파일 저장은 마지막 한 칸)
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+
+    font = Font(name=FONT_NAME, size=FONT_SIZE)
+    thin = Side(style="thin")
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal="center", vertical="top")
+
+    def styled(value, header=False):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        if header:
+            cell.border = header_border
+            cell.alignment = header_alignment
+        return cell
+
+    ws.append([styled(column, header=True) for column in columns])
+    total = len(records) + 1
+    for done, record in enumerate(records, start=1):
+        ws.append([styled(record[column]) for column in columns])
+        if progress:
+            progress(done, total)
+
+    wb.save(file_name)
+    return file_name
+
+
+def save_excel(parsed, file_name, progress=None):
+    """파싱 결과를 월/일/요일/근무시간 표로 저장 (전체 굴림 폰트)"""
+    records = roster.build_excel_records(parsed)
+    if logger.isEnabledFor(logging.DEBUG):
+        for record in records:
+            logger.debug(
+                "엑셀: %s월 %s일 %s", record["월"], record["일"], record["근무시간"]
+            )
+
+    write_workbook(records, file_name, progress=progress)
+    logger.info("엑셀 저장: %s (%d행)", file_name, len(records))
+    return file_name
+
+
+def save_csv(rows, file_name):
+    """구글 시트 행 목록을 CSV로 저장 (첫 행은 머리글, 엑셀 호환 utf-8-sig)"""
+    df = pd.DataFrame(rows[1:], columns=rows[0] if rows else None)
+    # 임시 파일에 다 쓴 뒤 교체 - 중간에 멈춰도 반쯤 쓴 CSV가 남지 않게
+    tmp_name = f"{file_name}.tmp"
+    df.to_csv(tmp_name, index=False, encoding="utf-8-sig")
+    os.replace(tmp_name, file_name)
+    return file_name
+
+
+def save_all(parsed_by_name, out_dir="", progress=None, pool=None):
+    """전체 근무자 엑셀 일괄 저장 - 저장된 파일 경로 목록 반환 (입력 순서)
+
+    openpyxl 저장은 CPU를 많이 쓰고 한 스레드에서만 돌아가므로 파일이
+    PARALLEL_MIN_FILES개 이상이면 프로세스 풀로 나눠 저장
+    pool: 재사용할 프로세스 풀 (없으면 이번 저장에만 만들어 사용)
+    progress(완료 개수, 전체 개수)가 주어지면 파일마다 호출 (완료 순서)
+    """
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    jobs = [
+        (parsed, excel_file_name(parsed, out_dir)) for parsed in parsed_by_name.values()
+    ]
+    total = len(jobs)
+    if pool is None and (total < PARALLEL_MIN_FILES or default_jobs() == 1):
+        saved = []
+        for done, (parsed, file_name) in enumerate(jobs, start=1):
+            saved.append(save_excel(parsed, file_name))
+            if progress:
+                progress(done, total)
+        return saved
+
+    own_pool = pool is None
+    if own_pool:
+        pool = export_pool()
+    try:
+        futures = {
+            pool.submit(save_excel, parsed, file_name): file_name
+            for parsed, file_name in jobs
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            future.result()  # 하위 프로세스 예외를 여기서 다시 발생
+            if progress:
+                progress(done, total)
+    finally:
+        if own_pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+    return [file_name for _, file_name in jobs]
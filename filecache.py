@@ -0,0 +1,108 @@
+"""
+디스크 LRU 캐시 - 키마다 파일 하나, 용량/개수 제한을 넘으면 가장 오래 안 쓴 것부터 삭제
+
+gsheet.WorksheetCache(JSON)와 aggregate.RosterDiskCache(pickle)가 폴더, 확장자,
+직렬화만 정해서 사용
+"""
+
+import logging
+import os
+import threading
+
+from paths import cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """키별 파일 캐시 - 읽을 때 파일 수정 시각을 갱신해서 LRU 순서로 사용
+
+    하위 클래스에서 folder(사용자 캐시 폴더 아래 이름), suffix(확장자),
+    binary(바이너리 파일 여부), dump/load(직렬화)를 정함
+    """
+
+    folder = None
+    suffix = ""
+    binary = False
+
+    def __init__(self, directory=None, max_bytes=None, max_entries=None):
+        self._directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        """캐시 폴더 (처음 사용할 때 생성)"""
+        if self._directory is None:
+            self._directory = cache_dir(self.folder)
+        return self._directory
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def dump(self, entry, f):
+        raise NotImplementedError
+
+    def load(self, f):
+        raise NotImplementedError
+
+    def open_file(self, path, mode):
+        if self.binary:
+            return open(path, mode + "b")
+        return open(path, mode, encoding="utf-8")
+
+    def read(self, key):
+        """캐시 항목 읽기 - 없거나 깨졌으면 None"""
+        with self._lock:
+            try:
+                path = self.path_for(key)
+                with self.open_file(path, "r") as f:
+                    entry = self.load(f)
+                os.utime(path)  # 최근 사용 표시 (LRU)
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.debug("캐시 읽기 실패: %s (%s)", key, e)
+                return None
+        return entry
+
+    def write(self, key, entry):
+        """캐시 항목 저장 (임시 파일에 쓴 뒤 교체해서 중간에 끊겨도 안전)"""
+        path = self.path_for(key)
+        with self._lock:
+            tmp_path = f"{path}.tmp"
+            with self.open_file(tmp_path, "w") as f:
+                self.dump(entry, f)
+            os.replace(tmp_path, path)
+            self.evict()
+
+    def evict(self):
+        """용량/개수 제한을 넘으면 가장 오래 안 쓴 파일부터 삭제"""
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        while files and (total > self.max_bytes or len(files) > self.max_entries):
+            _, size, path = files.pop(0)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(self.suffix):
+                    os.remove(os.path.join(self.directory, name))
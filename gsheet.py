@@ -0,0 +1,264 @@
+"""
+구글 시트 연동 - 인증된 gspread 클라이언트와 스프레드시트 핸들을 프로세스 전체에서 재사용
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+import cancel
+from filecache import FileCache
+from paths import basedir, env_path
+
+logger = logging.getLogger(__name__)
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    # 시트 수정 시각(modifiedTime) 확인용 - 캐시가 최신인지 값 전체를 받지 않고 확인
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+
+# 워크시트 캐시 용량 제한 (넘으면 가장 오래 안 쓴 것부터 삭제)
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+CACHE_MAX_ENTRIES = 48
+
+
+def network_errors():
+    """오프라인/네트워크 장애로 볼 예외 종류"""
+    from google.auth.exceptions import TransportError
+    from requests.exceptions import ConnectionError, Timeout
+
+    return (ConnectionError, Timeout, TransportError, OSError)
+
+
+def values_hash(values):
+    """워크시트 값의 해시 (리비전을 알 수 없을 때 변경 여부 비교용)"""
+    data = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class WorksheetCache(FileCache):
+    """구글 시트 워크시트 디스크 캐시 - (스프레드시트 ID, 워크시트 이름)별 JSON 파일
+
+    파일마다 값과 함께 시트 리비전(modifiedTime)과 값 해시를 저장
+    """
+
+    folder = "worksheets"
+    suffix = ".json"
+
+    def __init__(self, directory=None, max_bytes=CACHE_MAX_BYTES, max_entries=None):
+        super().__init__(directory, max_bytes, max_entries or CACHE_MAX_ENTRIES)
+
+    def dump(self, entry, f):
+        json.dump(entry, f, ensure_ascii=False)
+
+    def load(self, f):
+        return json.load(f)
+
+    def key_for(self, spreadsheet_id, title):
+        """파일 이름 (워크시트 이름은 파일명에 쓸 수 없는 문자가 있을 수 있어 해시)"""
+        return hashlib.sha1(f"{spreadsheet_id}\0{title}".encode("utf-8")).hexdigest()
+
+    def get(self, spreadsheet_id, title):
+        """캐시 항목 읽기 - 없거나 깨졌으면 None"""
+        entry = self.read(self.key_for(spreadsheet_id, title))
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("spreadsheet_id") != spreadsheet_id or entry.get("title") != title:
+            return None
+        return entry
+
+    def put(self, spreadsheet_id, title, values, revision=None):
+        """캐시 항목 저장"""
+        entry = {
+            "spreadsheet_id": spreadsheet_id,
+            "title": title,
+            "revision": revision,
+            "values_hash": values_hash(values),
+            "fetched_at": time.time(),
+            "values": values,
+        }
+        self.write(self.key_for(spreadsheet_id, title), entry)
+        return entry
+
+    def touch(self, spreadsheet_id, title, revision):
+        """값은 그대로고 리비전만 바뀐 경우 리비전만 갱신"""
+        entry = self.get(spreadsheet_id, title)
+        if entry is not None:
+            self.put(spreadsheet_id, title, entry["values"], revision)
+
+
+class SheetSession:
+    """구글 시트 세션 캐시 (인증 정보, gspread 클라이언트, 열린 스프레드시트)
+
+    버튼을 누를 때마다 토큰 교환과 메타데이터 요청을 반복하지 않도록 한 번 연
+    스프레드시트를 계속 사용함. 토큰 갱신은 google-auth 세션이 요청 직전에
+    만료 여부를 확인해서 만료됐을 때만 수행.
+    """
+
+    def __init__(self, cache=None):
+        self._lock = threading.Lock()
+        self.creds = None
+        self.client = None
+        self.spreadsheet = None
+        self._cache = cache
+
+    @property
+    def cache(self):
+        """워크시트 디스크 캐시 (처음 사용할 때 생성)"""
+        if self._cache is None:
+            self._cache = WorksheetCache()
+        return self._cache
+
+    def load_config(self):
+        """.env에서 서비스 계정 키 경로와 시트 URL 읽기"""
+        from dotenv import load_dotenv
+
+        load_dotenv(dotenv_path=env_path)
+        service_account_path = os.getenv("GSHEET_SERVICE_ACCOUNT")
+        sheet_url = os.getenv("GSHEET_URL")
+
+        if not service_account_path or not sheet_url:
+            raise Exception(
+                "json_path(구글 키 파일) 또는 GSHEET_URL 환경변수 누락/경로 오류"
+            )
+        return os.path.join(basedir, "config", service_account_path), sheet_url
+
+    @property
+    def is_open(self):
+        """스프레드시트가 이미 열려 있는지"""
+        return self.spreadsheet is not None
+
+    def open(self):
+        """스프레드시트 열기 - 이미 열려 있으면 캐시된 핸들 반환"""
+        with self._lock:
+            if self.spreadsheet is None:
+                import gspread
+                from google.oauth2.service_account import Credentials
+
+                json_path, sheet_url = self.load_config()
+                if self.creds is None:
+                    self.creds = Credentials.from_service_account_file(
+                        json_path, scopes=SCOPES
+                    )
+                    self.client = gspread.authorize(self.creds)
+                self.spreadsheet = self.client.open_by_url(sheet_url)
+            return self.spreadsheet
+
+    def fetch_values_many(self, worksheet_names):
+        """여러 워크시트 값을 values:batchGet 요청 한 번으로 가져오기 - {워크시트: 값}"""
+        from gspread.utils import absolute_range_name, fill_gaps
+
+        spreadsheet = self.open()
+        try:
+            # sh.worksheet(name)은 시트 메타데이터를 다시 받으므로 범위로 바로 요청
+            response = spreadsheet.values_batch_get(
+                [absolute_range_name(name) for name in worksheet_names]
+            )
+        except Exception:
+            # 권한/URL 변경 등으로 실패하면 다음 요청에서 다시 열도록 초기화
+            self.reset()
+            raise
+
+        value_ranges = response.get("valueRanges", [])
+        return {
+            name: fill_gaps(value_range.get("values", []))
+            for name, value_range in zip(worksheet_names, value_ranges)
+        }
+
+    def revision(self):
+        """스프레드시트 리비전(Drive modifiedTime) - 권한/API 문제로 못 얻으면 None"""
+        try:
+            return self.open().get_lastUpdateTime()
+        except network_errors():
+            raise
+        except Exception as e:
+            logger.debug("시트 리비전 확인 실패: %s", e)
+            return None
+
+    def spreadsheet_id(self):
+        """스프레드시트 ID - 네트워크 없이 URL에서 추출 (오프라인 캐시 조회용)"""
+        if self.spreadsheet is not None:
+            return self.spreadsheet.id
+
+        from gspread.utils import extract_id_from_url
+
+        _, sheet_url = self.load_config()
+        return extract_id_from_url(sheet_url)
+
+    def fetch_many_cached(self, worksheet_names, token=None):
+        """캐시를 거쳐 여러 워크시트 가져오기 - ({워크시트: 값}, 출처) 반환
+
+        캐시에 없거나 리비전이 다른 워크시트만 batchGet 한 번으로 다운로드.
+        token(cancel.CancelToken): 요청 사이마다 확인 - 진행 중인 요청은 끝까지 기다린
+        뒤 캐시를 건드리기 전에 cancel.Cancelled 발생
+        출처:
+            "cache": 시트 리비전이 캐시와 같아서 값 다운로드 생략
+            "network": 하나 이상 새로 다운로드 (캐시 갱신)
+            "offline": 네트워크 오류로 마지막으로 받은 사본 사용
+        """
+        cache = self.cache
+        try:
+            spreadsheet_id = self.open().id
+            cancel.check(token)
+            revision = self.revision()
+            cancel.check(token)
+            entries = {
+                name: cache.get(spreadsheet_id, name) for name in worksheet_names
+            }
+            stale = [
+                name
+                for name, entry in entries.items()
+                if entry is None or not revision or entry["revision"] != revision
+            ]
+            fetched = self.fetch_values_many(stale) if stale else {}
+            cancel.check(token)
+        except network_errors() as e:
+            logger.warning("네트워크 오류로 캐시된 사본 사용: %s", e)
+            spreadsheet_id = self.spreadsheet_id()
+            values = {}
+            for name in worksheet_names:
+                entry = cache.get(spreadsheet_id, name)
+                if entry is None:
+                    raise
+                values[name] = entry["values"]
+            return values, "offline"
+
+        for name, values in fetched.items():
+            entry = entries[name]
+            try:
+                if entry is not None and entry["values_hash"] == values_hash(values):
+                    # 다른 워크시트가 바뀌어 리비전만 달라진 경우
+                    cache.touch(spreadsheet_id, name, revision)
+                else:
+                    cache.put(spreadsheet_id, name, values, revision)
+            except OSError as e:
+                # 캐시 저장 실패는 무시 (다음에 다시 다운로드)
+                logger.warning("워크시트 캐시 저장 실패: %s", e)
+
+        values = {
+            name: fetched[name] if name in fetched else entries[name]["values"]
+            for name in worksheet_names
+        }
+        return values, "network" if stale else "cache"
+
+    def reset(self):
+        """캐시된 스프레드시트 핸들 버리기 (인증 정보는 유지)"""
+        with self._lock:
+            self.spreadsheet = None
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """프로세스 전체에서 공유하는 SheetSession"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = SheetSession()
+        return _session
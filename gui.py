@@ -0,0 +1,1661 @@
+"""
+근무시간 병합기 GUI - PyQt5 화면과 작업 스레드
+"""
+
+import sys
+import os
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# pandas(roster/export), matplotlib, gspread, openpyxl은 첫 화면 속도를 위해
+# 실제로 필요한 시점에 불러옴 (lazy import)
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QWidget,
+    QPushButton,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QFileDialog,
+    QLabel,
+    QMessageBox,
+    QLineEdit,
+    QComboBox,
+    QStackedWidget,
+    QSpinBox,
+    QGroupBox,
+    QProgressBar,
+    QProgressDialog,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
+    QHeaderView,
+)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPixmap, QIcon
+
+import cancel
+import profiler
+from paths import basedir
+
+# file URI 접두어를 붙여 절대경로로 처리
+# summer_img_path = os.path.join(basedir, "summer.png").replace("\\", "/")
+arctic_img_path = os.path.join(basedir, "assets", "img", "gu.png")
+icon_path = os.path.join(basedir, "assets", "ico", "zzangu.ico")
+
+
+def init_app(self):
+    """애플리케이션 초기화 및 심플 화이트 스타일 UI 적용"""
+    self.setWindowTitle("근무시간 병합기")
+    self.setGeometry(100, 100, 1100, 850)
+    self.setWindowIcon(QIcon(icon_path))
+    self.setAcceptDrops(True)
+    self.setStyleSheet(
+        """
+        QWidget {
+            background-color: #edf5f7;
+            font-family: Consolas, monospace;
+        }
+        QGroupBox {
+            background: transparent;
+        }
+        QPushButton {
+            background-color: #FFEDB3;
+            border: 2px solid #F4A460;
+            border-radius: 8px;
+            padding: 8px 16px;
+            font-family: Consolas, monospace;
+        }
+        QPushButton:hover {
+            background-color: #FFE066;
+        }
+        QLineEdit, QComboBox, QSpinBox {
+            background-color: #FFFFFF;
+            border: 1px solid #CCCCCC;
+            border-radius: 4px;
+            padding: 4px;
+            font-family: Consolas, monospace;
+        }
+        """
+    )
+    # 배경 레이블 제거
+    if hasattr(self, "bg_label"):
+        self.bg_label.hide()
+        del self.bg_label
+
+
+def resizeEvent(self, event):
+    """윈도우 크기 변경시 배경 이미지도 같이 리사이즈"""
+    super().resizeEvent(event)
+    if hasattr(self, "bg_label"):
+        self.bg_label.setGeometry(self.rect())
+        self.bg_label.lower()
+
+
+def create_image_widget(self):
+    """이미지 위젯 생성: arctic_fox.png 사용"""
+    image_label = QLabel(self)
+    pixmap = QPixmap(arctic_img_path)
+    image_label.setPixmap(pixmap)
+    image_label.setAlignment(Qt.AlignCenter)
+    image_label.setStyleSheet("margin-bottom: 20px;")
+    image_label.setFixedHeight(180)
+    image_label.setScaledContents(True)
+    image_label.setMaximumWidth(350)
+    return image_label
+
+
+class ScheduleApp(QWidget):
+    """근무시간 병합기 메인 애플리케이션"""
+
+    def __init__(self):
+        super().__init__()
+        # 구글 시트에서 가져온 {워크시트: 행 목록} (CSV 파일 없이 바로 파싱에 사용)
+        self.gsheet_sheets = None
+        # 취소했지만 아직 확인 지점에 도달하지 않은 작업 스레드 (끝날 때까지 참조 유지)
+        self.cancelled_workers = []
+        # 엑셀 저장 대기열 - 한 번에 하나씩 순서대로 저장
+        self.export_pool = QThreadPool(self)
+        self.export_pool.setMaxThreadCount(1)
+        self.pending_exports = 0
+        # 불러온 시트의 전체 근무자 통계 {source, month, fingerprint, stats} (명단 페이지)
+        self.roster = None
+        self.init_app()
+        self.setup_pages()
+        self.init_state()
+
+    def init_app(self):
+        """애플리케이션 초기화 및 심플 화이트 스타일 UI 적용"""
+        self.setWindowTitle("딸깍 딸깍")
+        self.setGeometry(100, 100, 1100, 850)
+        self.setAcceptDrops(True)
+        self.setStyleSheet(
+            """
+            QWidget {
+                background-color: #FFFFFF;
+                font-family: Consolas, monospace;
+            }
+            QGroupBox {
+                background: transparent;
+            }
+            QPushButton {
+                background-color: #FFEDB3;
+                border: 2px solid #F4A460;
+                border-radius: 8px;
+                padding: 8px 16px;
+                font-family: Consolas, monospace;
+            }
+            QPushButton:hover {
+                background-color: #FFE066;
+            }
+            QLineEdit, QComboBox, QSpinBox {
+                background-color: #FFFFFF;
+                border: 1px solid #CCCCCC;
+                border-radius: 4px;
+                padding: 4px;
+                font-family: Consolas, monospace;
+            }
+            """
+        )
+        # 배경 레이블 제거
+        if hasattr(self, "bg_label"):
+            self.bg_label.hide()
+            del self.bg_label
+
+    def closeEvent(self, event):
+        """창을 닫을 때 취소한 작업 스레드가 멈출 때까지 기다림"""
+        for worker in self.cancelled_workers:
+            worker.wait()
+        # 대기 중인 엑셀 저장은 끝까지 마침
+        self.export_pool.waitForDone()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        """윈도우 크기 변경시 배경 이미지도 같이 리사이즈"""
+        super().resizeEvent(event)
+        if hasattr(self, "bg_label"):
+            self.bg_label.setGeometry(self.rect())
+
+    def setup_pages(self):
+        """페이지 구성"""
+        self.stacked = QStackedWidget(self)
+        self.page1 = QWidget()
+        self.page2 = QWidget()
+        self.page3 = QWidget()
+
+        self.init_page1()
+        self.init_page2()
+        self.init_page3()
+
+        self.stacked.addWidget(self.page1)
+        self.stacked.addWidget(self.page2)
+        self.stacked.addWidget(self.page3)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.stacked)
+        layout.addLayout(self.create_export_bar())
+        self.setLayout(layout)
+
+    def create_export_bar(self):
+        """엑셀 저장 진행 표시줄 (두 페이지 공통, 저장 중일 때만 표시)"""
+        layout = QHBoxLayout()
+        self.export_label = QLabel()
+        self.export_label.setStyleSheet("font-size: 14px;")
+        self.export_bar = QProgressBar()
+        self.export_bar.setRange(0, 100)
+        self.export_bar.setMaximumWidth(300)
+        self.export_bar.hide()
+        layout.addWidget(self.export_label, stretch=1)
+        layout.addWidget(self.export_bar)
+        return layout
+
+    def init_state(self):
+        """상태 변수 초기화"""
+        self.last_stats = None
+        self.excel_saved = False
+        self.total_hours = 0
+        self.shown_parsed = None  # 페이지 2에 표시 중인 중간 결과
+
+    def init_page1(self):
+        """페이지 1: 입력 화면"""
+        layout = QVBoxLayout()
+
+        # 상단 여백
+        layout.addSpacing(20)
+
+        # 이미지 중앙 배치 (상단 중앙)
+        image_label = QLabel(self)
+        pixmap = QPixmap(arctic_img_path)
+        image_label.setPixmap(pixmap)
+        image_label.setAlignment(Qt.AlignCenter)
+        image_label.setStyleSheet("margin-bottom: 20px;")
+        image_label.setFixedHeight(180)
+        image_label.setScaledContents(True)
+        image_label.setMaximumWidth(350)
+
+        image_row = QHBoxLayout()
+        image_row.addStretch()
+        image_row.addWidget(image_label)
+        image_row.addStretch()
+        layout.addLayout(image_row)
+
+        # 여백
+        layout.addSpacing(30)
+
+        # 입력 폼
+        layout.addWidget(self.create_input_group())
+        layout.addSpacing(20)
+        layout.addWidget(self.create_file_group())
+
+        # 여백
+        layout.addSpacing(40)
+
+        # 버튼
+        layout.addLayout(self.create_page1_buttons())
+
+        # 하단 여백
+        layout.addSpacing(50)
+        layout.addStretch()
+
+        self.page1.setLayout(layout)
+
+    def init_page2(self):
+        """페이지 2: 통계 화면"""
+        layout = QVBoxLayout()
+
+        # 상단 여백
+        layout.addSpacing(20)
+
+        # 통계 및 그래프 (더 큰 공간 할당)
+        stats_group = self.create_stats_group()
+        layout.addWidget(stats_group, stretch=3)  # 3/4 공간 할당
+
+        layout.addSpacing(15)
+
+        # 시급/월급 (작은 공간 할당)
+        wage_group = self.create_wage_group()
+        layout.addWidget(wage_group, stretch=1)  # 1/4 공간 할당
+
+        layout.addSpacing(15)
+
+        # 버튼
+        layout.addLayout(self.create_page2_buttons())
+
+        # 하단 여백
+        layout.addSpacing(20)
+
+        self.page2.setLayout(layout)
+
+    def create_image_widget(self):
+        """이미지 위젯 생성"""
+        image_label = QLabel(self)
+        pixmap = QPixmap(arctic_img_path)
+        image_label.setPixmap(pixmap)
+        image_label.setAlignment(Qt.AlignCenter)
+        image_label.setStyleSheet("margin-bottom: 20px;")
+        image_label.setFixedHeight(180)
+        image_label.setScaledContents(True)
+        image_label.setMaximumWidth(350)
+        return image_label
+
+    def create_input_group(self):
+        """입력 그룹 생성"""
+        group = QGroupBox("근무자 정보 입력")
+        group.setStyleSheet("font-size: 20px; font-weight: bold;")
+        layout = QFormLayout()
+
+        # 이름 입력
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("예: 권혁준")
+        self.name_input.setStyleSheet("font-size: 20px; padding: 6px;")
+        self.name_input.setFixedHeight(50)
+
+        # 월 선택
+        self.month_combo = QComboBox()
+        self.month_combo.addItems(
+            [
+                "12-1",
+                "1-2",
+                "2-3",
+                "3-4",
+                "4-5",
+                "5-6",
+                "6-7",
+                "7-8",
+                "8-9",
+                "9-10",
+                "10-11",
+                "11-12",
+            ]
+        )
+        self.month_combo.setStyleSheet("font-size: 20px; padding: 6px;")
+        self.month_combo.setFixedHeight(50)
+
+        # 끝 월: 구글 시트에서 여러 달을 한 번에 가져올 때 사용 (기본은 시작 월과 같음)
+        self.month_end_combo = QComboBox()
+        self.month_end_combo.addItems(
+            [self.month_combo.itemText(i) for i in range(self.month_combo.count())]
+        )
+        self.month_end_combo.setStyleSheet("font-size: 20px; padding: 6px;")
+        self.month_end_combo.setFixedHeight(50)
+        self.month_combo.currentIndexChanged.connect(
+            self.month_end_combo.setCurrentIndex
+        )
+
+        month_row = QHBoxLayout()
+        month_row.addWidget(self.month_combo, stretch=1)
+        month_row.addWidget(QLabel("~"))
+        month_row.addWidget(self.month_end_combo, stretch=1)
+
+        layout.addRow("이름", self.name_input)
+        layout.addRow("근무 월", month_row)
+        group.setLayout(layout)
+        return group
+
+    def create_file_group(self):
+        """파일 선택 그룹 생성 + 구글 시트 버튼 추가"""
+        group = QGroupBox("CSV 파일 선택")
+        group.setStyleSheet("font-size: 20px; font-weight: bold;")
+        layout = QHBoxLayout()
+
+        self.file_path = QLineEdit()
+        self.file_path.setReadOnly(True)
+        self.file_path.setPlaceholderText("드래그하거나 '찾아보기' 버튼 클릭")
+        self.file_path.setStyleSheet("font-size: 20px; padding: 6px;")
+        self.file_path.setFixedHeight(50)
+
+        file_button = QPushButton("찾아보기")
+        file_button.setFixedWidth(120)
+        file_button.setFixedHeight(50)
+        file_button.setStyleSheet("font-size: 20px; padding: 8px; font-weight: bold")
+        file_button.clicked.connect(self.select_file)
+
+        # 구글 시트에서 가져오기 버튼 추가
+        gsheet_button = QPushButton("개쩌는 딸깍")
+        gsheet_button.setFixedWidth(180)
+        gsheet_button.setFixedHeight(50)
+        gsheet_button.setStyleSheet(
+            "font-size: 20px; padding: 8px; font-weight: bold; background-color: #c2f0fc;"
+        )
+        gsheet_button.clicked.connect(self.on_gsheet_btn_clicked)
+
+        # 가져온 구글 시트를 CSV로 저장하고 싶을 때만 사용
+        self.export_csv_button = QPushButton("CSV 저장")
+        self.export_csv_button.setFixedWidth(120)
+        self.export_csv_button.setFixedHeight(50)
+        self.export_csv_button.setStyleSheet(
+            "font-size: 20px; padding: 8px; font-weight: bold"
+        )
+        self.export_csv_button.setEnabled(False)
+        self.export_csv_button.clicked.connect(self.export_gsheet_csv)
+
+        layout.addWidget(self.file_path)
+        layout.addWidget(file_button)
+        layout.addWidget(gsheet_button)
+        layout.addWidget(self.export_csv_button)
+        group.setLayout(layout)
+        return group
+
+    def selected_months(self):
+        """선택한 근무 월 범위 (예: 8-9 ~ 10-11 → ["8-9", "9-10", "10-11"])"""
+        months = [self.month_combo.itemText(i) for i in range(self.month_combo.count())]
+        start = self.month_combo.currentIndex()
+        end = self.month_end_combo.currentIndex()
+        count = (end - start) % len(months) + 1
+        return [months[(start + i) % len(months)] for i in range(count)]
+
+    def on_gsheet_btn_clicked(self):
+        """구글 시트에서 선택한 달의 워크시트 가져오기 (여러 달이면 요청 한 번)"""
+        name = self.name_input.text().strip()
+        month_ranges = self.selected_months()
+        if not name or not month_ranges:
+            QMessageBox.warning(self, "오류", "이름과 근무 월을 먼저 입력하세요.")
+            return
+
+        # 프로그레스 다이얼로그 생성
+        self.progress_dialog = QProgressDialog(
+            "구글 시트에서 데이터 가져오는 중...", "취소", 0, 100, self
+        )
+        self.progress_dialog.setWindowTitle("진행 상황")
+        self.progress_dialog.setModal(True)
+        self.progress_dialog.canceled.connect(self.cancel_gsheet_download)
+        self.progress_dialog.show()
+
+        # 작업 스레드 시작
+        self.google_sheets_worker = GoogleSheetsWorker(month_ranges)
+        self.google_sheets_worker.progress.connect(self.update_progress)
+        self.google_sheets_worker.status.connect(self.update_status)
+        self.google_sheets_worker.finished.connect(self.on_gsheet_download_finished)
+        self.google_sheets_worker.error.connect(self.show_error_message)
+        self.google_sheets_worker.start()
+
+    def cancel_gsheet_download(self):
+        """구글 시트 다운로드 취소"""
+        if hasattr(self, "google_sheets_worker"):
+            self.cancel_worker(self.google_sheets_worker)
+
+    def cancel_worker(self, worker):
+        """작업 취소 요청 - 바로 반환하고, 스레드는 다음 확인 지점에서 스스로 멈춤
+
+        결과 시그널은 끊어서 늦게 끝난 작업이 화면을 바꾸지 않게 함
+        """
+        for signal in (worker.progress, worker.status, worker.finished, worker.error):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # 연결된 슬롯 없음
+        worker.token.cancel()
+
+        self.cancelled_workers = [w for w in self.cancelled_workers if w.isRunning()]
+        if worker.isRunning():
+            self.cancelled_workers.append(worker)
+
+    def close_progress_dialog(self, dialog):
+        """진행 다이얼로그 닫기 - close()도 canceled를 보내므로 취소 연결을 먼저 끊음
+
+        끊지 않으면 끝난 작업의 취소 토큰이 켜져서 이어지는 단계가 취소됨
+        """
+        try:
+            dialog.canceled.disconnect()
+        except TypeError:
+            pass  # 연결된 슬롯 없음
+        dialog.close()
+
+    def update_progress(self, value):
+        """진행 상황 업데이트"""
+        if hasattr(self, "progress_dialog"):
+            self.progress_dialog.setValue(value)
+
+    def update_status(self, message):
+        """상태 메시지 업데이트"""
+        if hasattr(self, "progress_dialog"):
+            self.progress_dialog.setLabelText(message)
+
+    def on_gsheet_download_finished(self, sheets):
+        """구글 시트 다운로드 완료 처리 - 가져온 행은 메모리에만 보관"""
+        self.gsheet_sheets = sheets
+        self.file_path.setText(f"구글 시트: {self.gsheet_label()}")
+        self.export_csv_button.setEnabled(True)
+        if hasattr(self, "progress_dialog"):
+            self.close_progress_dialog(self.progress_dialog)
+        row_counts = ", ".join(
+            f"{title} {len(rows)}행" for title, rows in sheets.items()
+        )
+        QMessageBox.information(
+            self,
+            "가져오기 완료",
+            f"구글 시트에서 데이터를 가져왔습니다:\n"
+            f"{row_counts}\n"
+            f"{GoogleSheetsWorker.ORIGIN_MESSAGES[self.google_sheets_worker.origin]}",
+        )
+
+    def gsheet_label(self):
+        """가져온 워크시트 범위 표시 (예: "8-9~10-11")"""
+        titles = list(self.gsheet_sheets)
+        if len(titles) == 1:
+            return titles[0]
+        return f"{titles[0]}~{titles[-1]}"
+
+    def clear_gsheet_rows(self):
+        """가져온 구글 시트 데이터 버리기 (CSV 파일을 새로 고른 경우 등)"""
+        self.gsheet_sheets = None
+        self.export_csv_button.setEnabled(False)
+
+    def current_source(self):
+        """파싱할 원본 - CSV 파일 경로, 구글 시트 행 목록(한 달) 또는 {근무월: 행 목록}"""
+        if self.gsheet_sheets is not None:
+            if len(self.gsheet_sheets) == 1:
+                return next(iter(self.gsheet_sheets.values()))
+            return self.gsheet_sheets
+        return self.file_path.text().strip()
+
+    def show_error_message(self, message):
+        """에러 메시지 표시"""
+        if hasattr(self, "progress_dialog"):
+            self.close_progress_dialog(self.progress_dialog)
+        QMessageBox.critical(self, "오류", message)
+
+    def export_gsheet_csv(self):
+        """가져온 구글 시트 데이터를 CSV 파일로 저장 (사용자가 요청할 때만)"""
+        if self.gsheet_sheets is None:
+            return
+
+        if len(self.gsheet_sheets) == 1:
+            title = next(iter(self.gsheet_sheets))
+            file_name, _ = QFileDialog.getSaveFileName(
+                self, "CSV 파일 저장", f"{title}_from_api.csv", "CSV Files (*.csv)"
+            )
+            if not file_name:
+                return
+            targets = {title: file_name}
+        else:
+            # 여러 달은 폴더를 골라 워크시트마다 파일 하나씩 저장
+            out_dir = QFileDialog.getExistingDirectory(self, "CSV 저장 폴더 선택")
+            if not out_dir:
+                return
+            targets = {
+                title: os.path.join(out_dir, f"{title}_from_api.csv")
+                for title in self.gsheet_sheets
+            }
+
+        try:
+            import export
+
+            for title, file_name in targets.items():
+                export.save_csv(self.gsheet_sheets[title], file_name)
+        except Exception as e:
+            QMessageBox.critical(self, "오류 발생", str(e))
+            return
+        QMessageBox.information(
+            self,
+            "저장 완료",
+            "CSV 파일이 저장되었습니다:\n" + "\n".join(targets.values()),
+        )
+
+    def init_page2(self):
+        """페이지 2: 통계 화면"""
+        layout = QVBoxLayout()
+
+        # 상단 여백
+        layout.addSpacing(20)
+
+        # 통계 및 그래프 (더 큰 공간 할당)
+        stats_group = self.create_stats_group()
+        layout.addWidget(stats_group, stretch=3)  # 3/4 공간 할당
+
+        layout.addSpacing(15)
+
+        # 시급/월급 (작은 공간 할당)
+        wage_group = self.create_wage_group()
+        layout.addWidget(wage_group, stretch=1)  # 1/4 공간 할당
+
+        layout.addSpacing(15)
+
+        # 버튼
+        layout.addLayout(self.create_page2_buttons())
+
+        # 하단 여백
+        layout.addSpacing(20)
+
+        self.page2.setLayout(layout)
+
+    def create_stats_group(self):
+        """통계 그룹 생성"""
+        group = QGroupBox("근무 통계 및 시각화")
+        group.setStyleSheet("font-size: 15px; font-weight: bold;")
+        layout = QVBoxLayout()
+
+        # 통계 라벨
+        self.stats_label = QLabel()
+        self.stats_label.setStyleSheet(
+            "font-size: 20px; font-weight: bold; margin: 15px;"
+        )
+        self.stats_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.stats_label)
+
+        # 월별 합계, 주휴수당 대상 주, 한도 경고
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet("font-size: 14px; margin: 0 15px;")
+        self.summary_label.setAlignment(Qt.AlignCenter)
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        # 그래프는 처음 통계를 보여줄 때 생성 (ensure_chart)
+        self.figure = None
+        self.canvas = None
+        self.chart = None
+        self.chart_layout = layout
+
+        group.setLayout(layout)
+        return group
+
+    def create_wage_group(self):
+        """시급/월급 그룹 생성"""
+        group = QGroupBox("시급 및 월급 계산")
+        group.setStyleSheet("font-size: 15px; font-weight: bold;")
+        layout = QVBoxLayout()
+
+        # 최저시급 안내
+        min_wage_label = QLabel("2025년 최저 시급은 10,030원입니다.")
+        min_wage_label.setStyleSheet(
+            "font-size: 16px; color: #e67e22; font-weight: bold; margin: 8px;"
+        )
+        min_wage_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(min_wage_label)
+
+        # 시급 입력
+        form_layout = QFormLayout()
+        self.wage_input = QSpinBox()
+        self.wage_input.setRange(0, 100000)
+        self.wage_input.setSingleStep(500)
+        self.wage_input.setSuffix(" 원")
+        self.wage_input.setValue(10030)
+        self.wage_input.setStyleSheet("font-size: 16px; padding: 8px;")
+        self.wage_input.valueChanged.connect(self.update_salary)
+        form_layout.addRow("시급 입력:", self.wage_input)
+
+        # 연간 근무 한도 (0이면 확인 안 함)
+        self.annual_cap_input = QSpinBox()
+        self.annual_cap_input.setRange(0, 5000)
+        self.annual_cap_input.setSingleStep(10)
+        self.annual_cap_input.setSuffix(" 시간")
+        self.annual_cap_input.setSpecialValueText("확인 안 함")
+        self.annual_cap_input.setStyleSheet("font-size: 16px; padding: 8px;")
+        self.annual_cap_input.valueChanged.connect(self.update_summary)
+        form_layout.addRow("연간 한도:", self.annual_cap_input)
+
+        # 월급 표시
+        self.salary_label = QLabel("월급: - 원")
+        self.salary_label.setStyleSheet(
+            "font-size: 18px; color: #1a73e8; font-weight: bold;"
+        )
+        form_layout.addRow("", self.salary_label)
+
+        layout.addLayout(form_layout)
+        group.setLayout(layout)
+        return group
+
+    def create_page1_buttons(self):
+        """페이지 1 버튼 생성"""
+        layout = QHBoxLayout()
+
+        self.run_btn = QPushButton("엑셀로 저장 및 통계 보기")
+        self.run_btn.setStyleSheet(
+            """
+            QPushButton {
+                font-size: 18px; 
+                padding: 12px 20px; 
+                font-weight: bold;
+                min-width: 200px;
+                max-width: 300px;
+            }
+        """
+        )
+        self.run_btn.clicked.connect(self.on_run_btn_clicked)
+
+        # 전체 근무자 일괄 저장 버튼: 시트를 한 번만 훑어서 모든 근무자 엑셀 생성
+        self.batch_btn = QPushButton("전체 근무자 저장")
+        self.batch_btn.setStyleSheet(
+            """
+            QPushButton {
+                font-size: 18px; 
+                padding: 12px 20px; 
+                min-width: 160px;
+                max-width: 220px;
+            }
+        """
+        )
+        self.batch_btn.clicked.connect(self.on_batch_btn_clicked)
+
+        layout.addStretch()
+        layout.addWidget(self.run_btn)
+        layout.addSpacing(20)
+        layout.addWidget(self.batch_btn)
+        layout.addStretch()
+
+        return layout
+
+    def create_page2_buttons(self):
+        """페이지 2 버튼 생성 (입력 화면으로 + 다른 사람 선택 버튼 추가)"""
+        layout = QHBoxLayout()
+
+        self.back_btn = QPushButton("입력 화면으로")
+        self.back_btn.setStyleSheet(
+            """
+            QPushButton {
+                font-size: 16px; 
+                padding: 10px 20px;
+                min-width: 120px;
+                max-width: 180px;
+            }
+        """
+        )
+        self.back_btn.clicked.connect(lambda: self.stacked.setCurrentIndex(0))
+
+        # '다른 사람 선택' 버튼: 불러온 시트의 근무자 명단(page3)으로 이동
+        self.change_user_btn = QPushButton("다른 사람 선택")
+        self.change_user_btn.setStyleSheet(
+            """
+            QPushButton {
+                font-size: 16px; 
+                padding: 10px 20px;
+                min-width: 120px;
+                max-width: 180px;
+            }
+        """
+        )
+        self.change_user_btn.clicked.connect(self.show_roster_page)
+
+        layout.addWidget(self.back_btn)
+        layout.addStretch()
+        layout.addWidget(self.change_user_btn)
+        layout.addStretch()
+
+        return layout
+
+    def init_page3(self):
+        """페이지 3: 불러온 시트의 전체 근무자 명단 (합계는 미리 계산해 둠)"""
+        layout = QVBoxLayout()
+        layout.addSpacing(20)
+
+        group = QGroupBox("근무자 명단")
+        group.setStyleSheet("font-size: 15px; font-weight: bold;")
+        group_layout = QVBoxLayout()
+
+        hint = QLabel("이름을 더블클릭하면 바로 통계를 볼 수 있습니다.")
+        hint.setStyleSheet("font-size: 14px; font-weight: normal; margin: 8px;")
+        hint.setAlignment(Qt.AlignCenter)
+        group_layout.addWidget(hint)
+
+        self.roster_table = QTableWidget(0, 4)
+        self.roster_table.setHorizontalHeaderLabels(
+            ["이름", "근무일수", "총 근무시간", "평균 1일 근무시간"]
+        )
+        self.roster_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.roster_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.roster_table.verticalHeader().hide()
+        self.roster_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.roster_table.setStyleSheet("font-size: 15px; font-weight: normal;")
+        self.roster_table.itemActivated.connect(
+            lambda item: self.show_roster_person(self.roster_row_name(item.row()))
+        )
+        group_layout.addWidget(self.roster_table)
+        group.setLayout(group_layout)
+        layout.addWidget(group, stretch=1)
+
+        layout.addSpacing(15)
+
+        buttons = QHBoxLayout()
+        button_style = """
+            QPushButton {
+                font-size: 16px; 
+                padding: 10px 20px;
+                min-width: 120px;
+                max-width: 180px;
+            }
+        """
+        back_btn = QPushButton("통계로 돌아가기")
+        back_btn.setStyleSheet(button_style)
+        back_btn.clicked.connect(lambda: self.stacked.setCurrentIndex(1))
+
+        show_btn = QPushButton("통계 보기")
+        show_btn.setStyleSheet(button_style)
+        show_btn.clicked.connect(self.show_selected_person)
+
+        export_btn = QPushButton("선택한 사람 엑셀 저장")
+        export_btn.setStyleSheet(button_style)
+        export_btn.clicked.connect(self.export_selected_people)
+
+        # 처음부터 다시: 입력과 명단을 모두 지우고 page1로 이동
+        new_btn = QPushButton("새 파일로 시작")
+        new_btn.setStyleSheet(button_style)
+        new_btn.clicked.connect(self.reset_app)
+
+        buttons.addWidget(back_btn)
+        buttons.addStretch()
+        buttons.addWidget(show_btn)
+        buttons.addWidget(export_btn)
+        buttons.addStretch()
+        buttons.addWidget(new_btn)
+        layout.addLayout(buttons)
+
+        layout.addSpacing(20)
+        self.page3.setLayout(layout)
+
+    def reset_app(self):
+        """다른 사람 선택 시 전체 입력 및 상태 초기화 후 페이지1 전환"""
+        self.name_input.clear()
+        self.file_path.clear()
+        self.clear_gsheet_rows()
+        self.wage_input.setValue(10030)
+        self.salary_label.setText("월급: - 원")
+        self.stats_label.setText("")
+        self.summary_label.setText("")
+        self.shown_parsed = None
+        self.excel_saved = False
+        self.last_stats = None
+        self.roster = None
+        self.roster_table.setRowCount(0)
+        if self.chart is not None:
+            self.chart.clear()
+        self.run_btn.setText("엑셀로 저장 및 통계 보기")
+        self.stacked.setCurrentIndex(0)
+
+    def on_run_btn_clicked(self):
+        """실행 버튼 클릭 처리"""
+        if not self.validate_input():
+            return
+
+        name = self.name_input.text().strip()
+        source = self.current_source()
+
+        # 프로그레스 다이얼로그 생성
+        self.data_progress_dialog = QProgressDialog(
+            "데이터 처리 중...", "취소", 0, 100, self
+        )
+        self.data_progress_dialog.setWindowTitle("데이터 분석 진행 상황")
+        self.data_progress_dialog.setModal(True)
+        self.data_progress_dialog.canceled.connect(self.cancel_data_processing)
+        self.data_progress_dialog.show()
+
+        # 단계별 시간 측정 - 그래프까지 같은 측정으로 이어짐 (엑셀 저장은 따로 측정)
+        timer = profiler.StageTimer(DataProcessingWorker.STAGES + ["chart"], label=name)
+
+        # 데이터 처리 스레드 시작
+        self.data_worker = DataProcessingWorker(
+            source, name, self.month_combo.currentText(), timer
+        )
+        self.data_worker.progress.connect(self.update_data_progress)
+        self.data_worker.status.connect(self.update_data_status)
+        self.data_worker.finished.connect(self.on_data_processing_finished)
+        self.data_worker.error.connect(self.show_data_error)
+        self.data_worker.start()
+
+    def on_batch_btn_clicked(self):
+        """전체 근무자 일괄 저장 버튼 클릭 처리"""
+        if not self.validate_source():
+            return
+
+        self.data_progress_dialog = QProgressDialog(
+            "전체 근무자 처리 중...", "취소", 0, 100, self
+        )
+        self.data_progress_dialog.setWindowTitle("일괄 저장 진행 상황")
+        self.data_progress_dialog.setModal(True)
+        self.data_progress_dialog.canceled.connect(self.cancel_data_processing)
+        self.data_progress_dialog.show()
+
+        self.data_worker = BatchProcessingWorker(
+            self.current_source(), self.month_combo.currentText()
+        )
+        self.data_worker.progress.connect(self.update_data_progress)
+        self.data_worker.status.connect(self.update_data_status)
+        self.data_worker.finished.connect(self.on_batch_processing_finished)
+        self.data_worker.error.connect(self.show_data_error)
+        self.data_worker.start()
+
+    def on_batch_processing_finished(self, stats_by_name):
+        """전체 근무자 일괄 저장 완료 처리 - 결과는 명단 페이지에도 사용"""
+        if hasattr(self, "data_progress_dialog"):
+            self.close_progress_dialog(self.data_progress_dialog)
+        self.set_roster(stats_by_name, self.data_worker)
+
+        summary = "\n".join(
+            f"{name}: {stats['days']}일, {stats['total_hours']:.2f}시간"
+            for name, stats in stats_by_name.items()
+        )
+        QMessageBox.information(
+            self,
+            "일괄 저장 완료",
+            f"{len(stats_by_name)}명의 엑셀 파일이 저장되었습니다:\n{summary}",
+        )
+
+    def roster_fingerprint(self, source):
+        """명단이 만들어진 원본인지 확인하는 값 - CSV는 수정시각/크기, 시트는 객체 자체"""
+        if isinstance(source, str):
+            import aggregate
+
+            try:
+                return aggregate.source_fingerprint(source)
+            except OSError:
+                return None
+        return id(source)
+
+    def roster_matches(self, source, month):
+        """보관 중인 명단이 지금 원본/근무 월의 것인지"""
+        roster = self.roster
+        return (
+            roster is not None
+            and roster["month"] == month
+            and (roster["source"] is source or roster["source"] == source)
+            and roster["fingerprint"] == self.roster_fingerprint(source)
+        )
+
+    def set_roster(self, stats_by_name, worker):
+        """전체 근무자 통계 보관 후 명단 표 채우기"""
+        self.roster = {
+            "source": worker.source,
+            "month": worker.month_combo_text,
+            "fingerprint": self.roster_fingerprint(worker.source),
+            "stats": stats_by_name,
+        }
+
+        table = self.roster_table
+        table.setSortingEnabled(False)
+        table.setRowCount(len(stats_by_name))
+        for row, (name, stats) in enumerate(stats_by_name.items()):
+            values = [
+                name,
+                stats["days"],
+                round(stats["total_hours"], 2),
+                round(stats["avg_hours"], 2),
+            ]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)  # 숫자는 숫자 순으로 정렬
+                table.setItem(row, col, item)
+        table.setSortingEnabled(True)
+
+    def show_roster_page(self):
+        """근무자 명단 페이지 - 명단이 없거나 원본이 바뀌었을 때만 전체 근무자 처리"""
+        source = self.current_source()
+        month = self.month_combo.currentText()
+        if self.roster_matches(source, month):
+            self.stacked.setCurrentIndex(2)
+            return
+
+        self.data_progress_dialog = QProgressDialog(
+            "근무자 명단 만드는 중...", "취소", 0, 100, self
+        )
+        self.data_progress_dialog.setWindowTitle("근무자 명단")
+        self.data_progress_dialog.setModal(True)
+        self.data_progress_dialog.canceled.connect(self.cancel_data_processing)
+        self.data_progress_dialog.show()
+
+        # 이미 스캔한 시트는 근무월 캐시(aggregate.MonthCache)에서 바로 가져옴
+        self.data_worker = BatchProcessingWorker(source, month, save_excel=False)
+        self.data_worker.progress.connect(self.update_data_progress)
+        self.data_worker.status.connect(self.update_data_status)
+        self.data_worker.finished.connect(self.on_roster_loaded)
+        self.data_worker.error.connect(self.show_data_error)
+        self.data_worker.start()
+
+    def on_roster_loaded(self, stats_by_name):
+        """근무자 명단 준비 완료"""
+        if hasattr(self, "data_progress_dialog"):
+            self.close_progress_dialog(self.data_progress_dialog)
+        self.set_roster(stats_by_name, self.data_worker)
+        self.stacked.setCurrentIndex(2)
+
+    def roster_row_name(self, row):
+        return self.roster_table.item(row, 0).text()
+
+    def selected_roster_names(self):
+        rows = sorted({index.row() for index in self.roster_table.selectedIndexes()})
+        return [self.roster_row_name(row) for row in rows]
+
+    def show_selected_person(self):
+        names = self.selected_roster_names()
+        if not names:
+            QMessageBox.warning(self, "오류", "명단에서 근무자를 선택하세요.")
+            return
+        self.show_roster_person(names[0])
+
+    def show_roster_person(self, name):
+        """명단에서 고른 사람의 통계/그래프 표시 - 미리 계산한 결과 사용 (파싱 없음)"""
+        stats = self.roster["stats"][name]
+        self.name_input.setText(name)
+        self.last_stats = (stats, name, self.roster["source"])
+        self.excel_saved = False
+        self.run_btn.setText("엑셀로 저장 및 통계 보기")
+        self.show_stats_on_page2(stats)
+        self.stacked.setCurrentIndex(1)
+
+    def export_selected_people(self):
+        """명단에서 고른 사람들의 엑셀 저장 (대기열에 차례로 추가)"""
+        names = self.selected_roster_names()
+        if not names:
+            QMessageBox.warning(self, "오류", "명단에서 근무자를 선택하세요.")
+            return
+        for name in names:
+            self.queue_excel_export(
+                self.roster["stats"][name], name, self.roster["source"]
+            )
+
+    def cancel_data_processing(self):
+        """데이터 처리 취소"""
+        if hasattr(self, "data_worker"):
+            self.cancel_worker(self.data_worker)
+
+    def update_data_progress(self, value):
+        """데이터 처리 진행 상황 업데이트"""
+        if hasattr(self, "data_progress_dialog"):
+            self.data_progress_dialog.setValue(value)
+
+    def update_data_status(self, message):
+        """데이터 처리 상태 메시지 업데이트"""
+        if hasattr(self, "data_progress_dialog"):
+            self.data_progress_dialog.setLabelText(message)
+
+    def on_data_processing_finished(self, stats):
+        """데이터 처리 완료 처리"""
+        if hasattr(self, "data_progress_dialog"):
+            self.close_progress_dialog(self.data_progress_dialog)
+
+        name = self.name_input.text().strip()
+        source = self.current_source()
+        self.last_stats = (stats, name, source)
+        timer = self.data_worker.timer
+
+        # 슬롯에서 난 예외는 이벤트 루프까지 가면 프로그램이 종료되므로 여기서 처리
+        try:
+            if not self.excel_saved:
+                # 엑셀은 백그라운드에서 저장하고 통계는 바로 표시
+                self.queue_excel_export(stats, name, source)
+                self.excel_saved = True
+                self.run_btn.setText("통계 보기")
+
+            self.show_stats_on_page2(stats, timer)
+            self.stacked.setCurrentIndex(1)
+
+            # 단계별 시간 로그/JSON 기록 (SCHOOL_GYM_PROFILE)
+            timer.finish()
+        except Exception as e:
+            logger.exception("결과 표시 실패")
+            QMessageBox.warning(self, "오류", f"결과 표시 중 오류: {str(e)}")
+
+    def show_data_error(self, message):
+        """데이터 처리 에러 메시지 표시"""
+        if hasattr(self, "data_progress_dialog"):
+            self.close_progress_dialog(self.data_progress_dialog)
+        QMessageBox.warning(self, "오류", message)
+
+    def queue_excel_export(self, stats, name, source):
+        """엑셀 저장 작업을 대기열에 추가 - 앞의 저장이 끝나면 차례로 실행"""
+        task = ExcelExportTask(stats, name, source, self.month_combo.currentText())
+        task.signals.progress.connect(self.export_bar.setValue)
+        task.signals.status.connect(self.update_export_status)
+        task.signals.finished.connect(self.on_export_finished)
+        task.signals.error.connect(lambda message: self.on_export_error(stats, message))
+
+        self.pending_exports += 1
+        self.export_bar.setValue(0)
+        self.export_bar.show()
+        self.update_export_status("엑셀 저장 대기 중...")
+        self.export_pool.start(task)
+
+    def update_export_status(self, message):
+        """엑셀 저장 상태 표시 (대기 중인 저장 수 포함)"""
+        if self.pending_exports > 1:
+            message = f"{message} (대기 {self.pending_exports - 1}개)"
+        self.export_label.setText(message)
+
+    def export_done(self):
+        """저장 작업 하나 끝남 - 남은 작업이 없으면 진행 표시줄 숨김"""
+        self.pending_exports -= 1
+        if self.pending_exports == 0:
+            self.export_bar.hide()
+
+    def on_export_finished(self, file_name):
+        """엑셀 저장 완료"""
+        self.export_done()
+        self.update_export_status(f"저장 완료: {file_name}")
+
+    def on_export_error(self, stats, message):
+        """엑셀 저장 실패 - 지금 보고 있는 사람이면 다시 저장할 수 있게 되돌림"""
+        self.export_done()
+        self.export_label.setText("")
+        if self.last_stats is not None and self.last_stats[0] is stats:
+            self.excel_saved = False
+            self.run_btn.setText("엑셀로 저장 및 통계 보기")
+        QMessageBox.critical(self, "오류 발생", message)
+
+    def validate_input(self):
+        """입력 검증"""
+        name = self.name_input.text().strip()
+
+        if not name:
+            QMessageBox.warning(self, "오류", "근무자 이름을 입력하세요.")
+            return False
+
+        return self.validate_source()
+
+    def validate_source(self):
+        """CSV 파일 또는 가져온 구글 시트가 있는지 검증"""
+        if self.gsheet_sheets is not None:
+            return True
+
+        path = self.file_path.text().strip()
+        if not path or not path.endswith(".csv"):
+            QMessageBox.warning(self, "오류", "유효한 CSV 파일을 선택하세요.")
+            return False
+
+        return True
+
+    def get_stats(self, file_path, target_name):
+        """CSV 파일에서 통계 추출 (요일 포함)"""
+        import pandas as pd
+        from datetime import date
+
+        import roster
+
+        df = pd.read_csv(file_path)
+        df.rename(
+            columns={df.columns[0]: "날짜", df.columns[1]: "근무자"}, inplace=True
+        )
+        df.dropna(subset=["날짜", "근무자"], how="all", inplace=True)
+        df["날짜"] = df["날짜"].fillna(method="ffill")
+
+        mask = df.applymap(lambda x: target_name in str(x).strip())
+        positions = mask.stack()[mask.stack()].index.tolist()
+        if not positions:
+            return None
+        results = [(df.at[row, "날짜"], time) for row, time in positions]
+
+        date_order = []
+        for d, _ in results:
+            if d not in date_order:
+                date_order.append(d)
+
+        grouped = {}
+        for d, t in results:
+            grouped.setdefault(d, []).append(t)
+
+        day_list = []
+        hours_list = []
+        total_minutes = 0
+
+        for d in date_order:
+            merged_ranges = roster.merge_time_ranges(
+                [roster.parse_time_range(t) for t in grouped[d]]
+            )
+            day_minutes = roster.day_minutes(merged_ranges)
+            total_minutes += day_minutes
+            day_list.append(str(d))
+            hours_list.append(round(day_minutes / 60, 2))
+
+        # 날짜별 요일 정보 추가하여 day_labels 생성 (예: "7일 (목)")
+        weekday_kor = ["월", "화", "수", "목", "금", "토", "일"]
+        selected_range = self.month_combo.currentText()  # e.g., "5-6"
+        start_month = int(selected_range.split("-")[0])
+        cur_year = datetime.now().year
+        cur_month = start_month
+        prev_day = 0
+        day_labels = []
+        for d_str in day_list:
+            day_int = int(d_str.replace("일", ""))
+            if prev_day and day_int < prev_day:
+                cur_month += 1
+                if cur_month > 12:
+                    cur_month = 1
+                    cur_year += 1
+            prev_day = day_int
+            real_date = date(cur_year, cur_month, day_int)
+            weekday = weekday_kor[real_date.weekday()]
+            day_labels.append(f"{d_str} ({weekday})")
+
+        days = len(day_list)
+        total_hours = total_minutes / 60
+        avg_hours = total_hours / days if days else 0
+
+        return {
+            "days": days,
+            "total_hours": total_hours,
+            "avg_hours": avg_hours,
+            "day_list": day_list,
+            "hours_list": hours_list,
+            "day_labels": day_labels,
+        }
+
+    def save_to_excel(self, stats, name, csv_path):
+        """엑셀 파일 저장 (수정된 로직)"""
+        import pandas as pd
+
+        import export
+        import roster
+
+        df = pd.read_csv(csv_path)
+        df.dropna(subset=["Unnamed: 0", "Unnamed: 1"], how="all", inplace=True)
+        df.rename(columns={"Unnamed: 0": "날짜", "Unnamed: 1": "근무자"}, inplace=True)
+        df["날짜"] = df["날짜"].fillna(method="ffill")
+
+        mask = df.applymap(lambda x: name in str(x).strip())
+        positions = mask.stack()[mask.stack()].index.tolist()
+        results = [(df.at[row, "날짜"], time) for row, time in positions]
+
+        date_order = []
+        for d, _ in results:
+            if d not in date_order:
+                date_order.append(d)
+
+        grouped = {}
+        for d, t in results:
+            grouped.setdefault(d, []).append(t)
+
+        selected_range = self.month_combo.currentText()  # 예: "5-6"
+        start_month = int(selected_range.split("-")[0])  # 앞 숫자만 가져옴
+        start_year = datetime.now().year
+
+        weekday_kor = [
+            "월요일",
+            "화요일",
+            "수요일",
+            "목요일",
+            "금요일",
+            "토요일",
+            "일요일",
+        ]
+        cur_year, cur_month, prev_day = start_year, start_month, 0
+
+        records = []
+        for d_str in date_order:
+            day_int = int(d_str.replace("일", ""))
+            if prev_day and day_int < prev_day:
+                cur_month += 1
+                if cur_month > 12:
+                    cur_month = 1
+                    cur_year += 1
+            prev_day = day_int
+
+            from datetime import date
+
+            real_date = date(cur_year, cur_month, day_int)
+            weekday = weekday_kor[real_date.weekday()]
+            merged_ranges = roster.merge_time_ranges(
+                [roster.parse_time_range(t) for t in grouped[d_str]]
+            )
+            # 문자열로 변환
+            merged_times_str = roster.format_ranges(merged_ranges)
+
+            records.append(
+                {
+                    "월": cur_month,
+                    "일": day_int,
+                    "요일": weekday,
+                    "근무시간": merged_times_str,
+                }
+            )
+
+        file_name = f"{name}.xlsx"
+        export.write_workbook(records, file_name)
+        QMessageBox.information(
+            self, "저장 완료", f"엑셀 파일이 저장되었습니다:\n{file_name}"
+        )
+
+    def update_salary(self):
+        """월급 업데이트"""
+        wage = self.wage_input.value()
+        if hasattr(self, "total_hours"):
+            salary = int(self.total_hours * wage)
+            self.salary_label.setText(f"월급: <b>{salary:,} 원</b>")
+        else:
+            self.salary_label.setText("월급: - 원")
+
+    def select_file(self):
+        """파일 선택 다이얼로그"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "CSV 파일 선택", "", "CSV Files (*.csv)"
+        )
+        if file_path:
+            self.clear_gsheet_rows()
+            self.file_path.setText(file_path)
+
+    def dragEnterEvent(self, event):
+        """드래그 이벤트 처리"""
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        """드롭 이벤트 처리"""
+        urls = event.mimeData().urls()
+        if urls:
+            file_path = urls[0].toLocalFile()
+            if file_path.endswith(".csv"):
+                self.clear_gsheet_rows()
+                self.file_path.setText(file_path)
+
+    def show_stats_on_page2(self, stats, timer=None):
+        """페이지 2에 통계와 그래프 업데이트"""
+        self.stats_label.setText(
+            f"<span style='font-size:20px;'>"
+            f"총 근무일수: <b>{stats['days']}</b>일, "
+            f"총 근무시간: <b>{stats['total_hours']:.2f}</b>시간, "
+            f"평균 1일 근무시간: <b>{stats['avg_hours']:.2f}</b>시간"
+            f"</span>"
+        )
+        self.total_hours = stats["total_hours"]
+        self.shown_parsed = stats["parsed"]
+        self.update_salary()
+        self.update_summary()
+        if timer is not None:
+            # 그래프는 GUI 스레드에서 그리므로 취소 확인 없이 시간만 잼
+            timer.token = None
+        with profiler.stage(timer, "chart", len(stats["hours_list"])):
+            self.create_chart(stats)
+
+    def update_summary(self):
+        """월별 합계와 주휴수당/연간 한도 확인 결과 표시"""
+        if self.shown_parsed is None:
+            self.summary_label.setText("")
+            return
+
+        import aggregate
+
+        summary = aggregate.summarize(self.shown_parsed, self.annual_cap_input.value())
+        lines = []
+        if len(summary["per_month"]) > 1:
+            lines.append(
+                ", ".join(
+                    f"{month}: <b>{hours:.2f}</b>시간"
+                    for month, hours in summary["per_month"].items()
+                )
+            )
+        lines.append(
+            f"주휴수당 대상(주 {aggregate.WEEKLY_HOLIDAY_PAY_HOURS}시간 이상): "
+            f"<b>{summary['holiday_pay_weeks']}</b>주 / {len(summary['per_week'])}주"
+        )
+        lines.extend(
+            f"<span style='color:#e74c3c;'>{warning}</span>"
+            for warning in summary["warnings"]
+        )
+        self.summary_label.setText("<br>".join(lines))
+
+    def ensure_chart(self):
+        """그래프 영역 생성 - matplotlib은 페이지 2를 처음 보여줄 때 불러옴"""
+        if self.figure is not None:
+            return
+
+        import matplotlib
+
+        matplotlib.use("Qt5Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg as FigureCanvas,
+        )
+
+        # 그래프는 한글 깨짐 방지를 위해 Malgun Gothic 사용
+        plt.rcParams["font.family"] = "Malgun Gothic"
+        plt.rcParams["axes.unicode_minus"] = False
+
+        # 그래프 (비율 1/4 축소: figsize, 높이, 여백 모두 0.75배)
+        self.figure = plt.Figure(figsize=(9, 4.5), dpi=100)  # 12,6 -> 9,4.5
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumHeight(390)  # 520 -> 390
+        self.chart_layout.addWidget(self.canvas)
+
+        import chart
+
+        # 축과 막대는 한 번만 만들고 이후에는 값만 바꿈
+        self.chart = chart.HoursChart(self.figure, self.canvas)
+
+    def create_chart(self, stats):
+        """근무시간 그래프 갱신 (chart.HoursChart) - 기간이 길면 주/월 단위"""
+        import aggregate
+
+        self.ensure_chart()
+        series = aggregate.chart_series(stats)
+        self.chart.update(series["labels"], series["hours"], series["unit"])
+
+
+class ExportSignals(QObject):
+    """ExcelExportTask 시그널 (QRunnable은 QObject가 아니라서 따로 둠)"""
+
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(str)  # 성공 시 저장한 파일 경로
+    error = pyqtSignal(str)  # 에러 시 에러 메시지
+
+
+class ExcelExportTask(QRunnable):
+    """엑셀 저장 작업 - ScheduleApp.export_pool 대기열에서 GUI 스레드 밖으로 실행"""
+
+    def __init__(self, stats, name, source, month_range):
+        super().__init__()
+        self.signals = ExportSignals()
+        self.stats = stats
+        self.name = name
+        self.source = source
+        self.month_range = month_range
+        self.timer = profiler.StageTimer(["excel"], label=name)
+
+    def run(self):
+        try:
+            self.timer.progress = self.signals.progress.emit
+            self.timer.status = self.signals.status.emit
+
+            import export
+            import roster
+
+            with self.timer.stage("excel", 1):
+                # 데이터 처리 단계의 파싱 결과 재사용 (없을 때만 원본을 다시 읽음)
+                parsed = self.stats.get("parsed") if self.stats else None
+                if parsed is None:
+                    parsed = roster.parse_roster(
+                        roster.load_roster(self.source), self.name, self.month_range
+                    )
+                if parsed is None:
+                    self.signals.error.emit("해당 근무자의 데이터를 찾을 수 없습니다.")
+                    return
+
+                file_name = export.save_excel(
+                    parsed, export.excel_file_name(parsed), self.timer.advance
+                )
+
+            self.timer.finish()
+            self.signals.finished.emit(file_name)
+
+        except Exception as e:
+            logger.exception("엑셀 저장 실패")
+            self.signals.error.emit(f"엑셀 저장 중 오류: {str(e)}")
+
+
+class GoogleSheetsWorker(QThread):
+    """구글 시트 다운로드 작업 스레드"""
+
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(dict)  # 성공 시 {워크시트: 행 목록}
+    error = pyqtSignal(str)  # 에러 시 에러 메시지
+
+    # 데이터 출처별 안내 문구 (gsheet.SheetSession.fetch_many_cached 참고)
+    ORIGIN_MESSAGES = {
+        "cache": "시트 변경 없음 - 저장된 사본 사용",
+        "network": "구글 시트에서 새로 다운로드",
+        "offline": "오프라인 - 마지막으로 받은 사본 사용",
+    }
+
+    def __init__(self, worksheet_names):
+        super().__init__()
+        self.worksheet_names = worksheet_names
+        self.origin = None
+        self.token = cancel.CancelToken()
+
+    def run(self):
+        try:
+            self.status.emit("환경 설정 로딩 중...")
+            self.progress.emit(10)
+
+            # 구글 시트 관련 모듈은 버튼을 눌렀을 때만 불러옴
+            import gsheet
+
+            session = gsheet.get_session()
+            self.token.check()
+
+            if not session.is_open:
+                # 처음 한 번만 인증 + 시트 연결, 이후에는 열린 시트 재사용
+                self.status.emit("구글 시트 인증 중...")
+                self.progress.emit(30)
+
+            # 시트 리비전이 캐시와 같으면 값 다운로드 없이 캐시 사용
+            self.status.emit("데이터 확인 중...")
+            self.progress.emit(70)
+
+            # 여러 달도 batchGet 요청 한 번으로 가져옴
+            data, self.origin = session.fetch_many_cached(
+                self.worksheet_names, self.token
+            )
+
+            self.progress.emit(100)
+            self.status.emit(f"완료! ({self.ORIGIN_MESSAGES[self.origin]})")
+            self.finished.emit(data)
+
+        except cancel.Cancelled:
+            logger.debug("구글 시트 다운로드 취소")
+        except Exception as e:
+            logger.exception("구글 시트 다운로드 실패")
+            self.error.emit(str(e))
+
+
+class DataProcessingWorker(QThread):
+    """데이터 처리 작업 스레드"""
+
+    # 작업 스레드에서 재는 단계 (엑셀 저장/그래프는 완료 후 GUI 스레드에서 이어서 측정)
+    STAGES = ["csv_read", "headers", "name_scan", "merge", "calendar"]
+
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(dict)  # 성공 시 통계 데이터
+    error = pyqtSignal(str)  # 에러 시 에러 메시지
+
+    def __init__(self, source, target_name, month_combo_text, timer=None):
+        super().__init__()
+        # CSV 파일 경로, 구글 시트 행 목록 또는 여러 달 {근무월: 행 목록}
+        self.source = source
+        self.target_name = target_name
+        self.month_combo_text = month_combo_text
+        # 단계별 시간 측정 - 진행률도 측정한 단계 비중으로 계산
+        self.timer = timer or profiler.StageTimer(self.STAGES, label=target_name)
+        # 취소는 측정 단계/행 묶음마다 확인
+        self.token = cancel.CancelToken()
+        self.timer.token = self.token
+
+    def run(self):
+        try:
+            self.timer.progress = self.progress.emit
+            self.timer.status = self.status.emit
+            self.status.emit("CSV 파일 읽는 중...")
+
+            import aggregate
+            import roster
+
+            if isinstance(self.source, dict):
+                self.run_sheets(aggregate, roster)
+                return
+
+            # 같은 파일을 다시 불러오면 바뀐 헤더 블록만 다시 파싱
+            scanned = aggregate.get_cache().month(
+                self.month_combo_text, self.source, timer=self.timer
+            )
+
+            with self.timer.stage("name_scan") as record:
+                work_data = roster.lookup_work_data(
+                    scanned["index"], scanned["time_headers"], self.target_name
+                )
+                record["items"] = len(work_data)
+
+            if not work_data:
+                self.error.emit("입력한 이름이 CSV에 없습니다. 이름을 다시 확인하세요.")
+                return
+
+            parsed = roster.build_parsed(
+                work_data, self.target_name, self.month_combo_text, timer=self.timer
+            )
+
+            # 통계 결과에 중간 결과(parsed)가 포함되어 엑셀 저장 시 재사용됨
+            result = roster.build_stats(parsed)
+
+            self.status.emit("완료!")
+            self.finish(result)
+
+        except cancel.Cancelled:
+            logger.debug("데이터 처리 취소: %s", self.target_name)
+        except Exception as e:
+            logger.exception("데이터 처리 실패")
+            self.error.emit(f"데이터 처리 중 오류: {str(e)}")
+
+    def finish(self, result):
+        """완료 알림 - 이후 단계(그래프)는 GUI 스레드에서 같은 측정으로 이어 재므로
+        취소 토큰을 떼어서 작업이 끝난 뒤의 취소 요청이 영향을 주지 않게 함"""
+        self.timer.token = None
+        self.finished.emit(result)
+
+    def run_sheets(self, aggregate, roster):
+        """여러 달 워크시트를 각각 파싱한 뒤 실제 날짜 기준으로 합치기"""
+        self.status.emit(f"{len(self.source)}개월 근무 데이터 수집 중...")
+
+        parsed = aggregate.parse_sheets(self.source, self.target_name, timer=self.timer)
+
+        if parsed is None:
+            self.error.emit("입력한 이름이 시트에 없습니다. 이름을 다시 확인하세요.")
+            return
+
+        result = roster.build_stats(parsed)
+
+        self.status.emit("완료!")
+        self.finish(result)
+
+
+class BatchProcessingWorker(QThread):
+    """전체 근무자 일괄 처리 작업 스레드 - 시트 한 번 스캔으로 모든 근무자 처리"""
+
+    STAGES = ["csv_read", "headers", "name_scan", "merge", "calendar", "excel"]
+
+    progress = pyqtSignal(int)
+    status = pyqtSignal(str)
+    finished = pyqtSignal(dict)  # 성공 시 {이름: 통계 데이터}
+    error = pyqtSignal(str)  # 에러 시 에러 메시지
+
+    def __init__(self, source, month_combo_text, out_dir="", save_excel=True):
+        super().__init__()
+        # CSV 파일 경로, 구글 시트 행 목록 또는 여러 달 {근무월: 행 목록}
+        self.source = source
+        self.month_combo_text = month_combo_text
+        self.out_dir = out_dir
+        # False면 통계만 계산 (근무자 명단 페이지)
+        self.save_excel = save_excel
+        stages = self.STAGES if save_excel else self.STAGES[:-1]
+        self.token = cancel.CancelToken()
+        self.timer = profiler.StageTimer(stages, label="전체 근무자", token=self.token)
+
+    def run(self):
+        try:
+            self.timer.progress = self.progress.emit
+            self.timer.status = self.status.emit
+            self.status.emit("CSV 파일 읽는 중...")
+
+            import aggregate
+            import export
+            import roster
+
+            # 한 달이면 {근무월: 원본} 하나로 - 근무월 캐시를 같이 사용
+            sheets = self.source
+            if not isinstance(sheets, dict):
+                sheets = {self.month_combo_text: sheets}
+            parsed_by_name = aggregate.parse_all_sheets(sheets, timer=self.timer)
+
+            if not parsed_by_name:
+                self.error.emit("CSV에서 근무자를 찾을 수 없습니다.")
+                return
+
+            # 엑셀 저장 진행률은 저장을 마친 파일 수에 비례
+            if self.save_excel:
+                with self.timer.stage("excel", len(parsed_by_name)):
+                    self.status.emit(f"{len(parsed_by_name)}명 엑셀 저장 중...")
+                    export.save_all(
+                        parsed_by_name, self.out_dir, progress=self.timer.advance
+                    )
+
+            result = {
+                name: roster.build_stats(parsed)
+                for name, parsed in parsed_by_name.items()
+            }
+
+            self.progress.emit(100)
+            self.status.emit("완료!")
+            self.timer.finish()
+
+            self.finished.emit(result)
+
+        except cancel.Cancelled:
+            # 저장을 마친 파일은 그대로 두고, 남은 파일은 만들지 않음
+            logger.debug("전체 근무자 처리 취소")
+        except Exception as e:
+            logger.exception("데이터 처리 실패")
+            self.error.emit(f"데이터 처리 중 오류: {str(e)}")
+
+
+def main():
+    """GUI 실행"""
+    import log
+
+    log.setup_logging()
+    app = QApplication(sys.argv)
+    window = ScheduleApp()
+    window.show()
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
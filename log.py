@@ -0,0 +1,68 @@
+"""
+로그 설정 - 단계별 추적 메시지는 로그 레벨을 낮췄을 때만 기록
+
+환경 변수로도 설정 가능 (CLI는 --log-level, --log-file 인자 우선)
+    SCHOOL_GYM_LOG_LEVEL=DEBUG          # 기본 WARNING
+    SCHOOL_GYM_LOG_FILE=logs/app.log    # 지정하면 크기 제한 회전 로그 파일에도 기록
+"""
+
+import logging
+import logging.handlers
+import os
+import sys
+
+LEVEL_ENV = "SCHOOL_GYM_LOG_LEVEL"
+FILE_ENV = "SCHOOL_GYM_LOG_FILE"
+
+DEFAULT_LEVEL = "WARNING"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# 회전 로그 파일: 1MB씩 최대 3개 보관
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+
+def parse_level(level):
+    """레벨 이름("debug", "INFO" 등) 또는 숫자를 logging 레벨 값으로"""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).strip().upper())
+    if not isinstance(value, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {level}")
+    return value
+
+
+def setup_logging(level=None, log_file=None, default_level=DEFAULT_LEVEL):
+    """루트 로거 설정 - 인자 > 환경 변수 > default_level 순으로 적용
+
+    여러 번 호출해도 이 함수가 붙인 핸들러만 교체
+    """
+    level = parse_level(level or os.environ.get(LEVEL_ENV) or default_level)
+    log_file = log_file or os.environ.get(FILE_ENV)
+
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if getattr(h, "_school_gym", False)]:
+        root.removeHandler(handler)
+        handler.close()
+
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handlers.append(
+            logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUPS,
+                encoding="utf-8",
+                delay=True,
+            )
+        )
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        handler._school_gym = True
+        root.addHandler(handler)
+    root.setLevel(level)
@@ -0,0 +1,29 @@
+"""
+경로 설정 - exe 배포/소스 실행 모두에서 리소스 경로를 같은 방식으로 계산
+"""
+
+import os
+import sys
+
+# exe 배포 시 이미지 파일 경로 처리
+if getattr(sys, "frozen", False):
+    basedir = sys._MEIPASS
+else:
+    basedir = os.path.dirname(os.path.abspath(__file__))
+
+env_path = os.path.join(basedir, "config", ".env")
+
+APP_NAME = "school-gym"
+
+
+def cache_dir(*parts):
+    """사용자 캐시 폴더 (Windows: %LOCALAPPDATA%, 그 외: $XDG_CACHE_HOME 또는 ~/.cache)"""
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+    path = os.path.join(root, APP_NAME, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
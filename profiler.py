@@ -0,0 +1,177 @@
+"""
+단계별 소요 시간 측정 - 어느 시트가 어느 단계에서 느린지 확인
+
+    timer = StageTimer(["csv_read", "headers", ...], progress=..., status=...)
+    with timer.stage("csv_read") as record:
+        df = ...
+        record["items"] = len(df)
+    timer.finish()   # 로그 요약 + (설정 시) JSON 기록
+
+실행 요약은 SCHOOL_GYM_PROFILE 환경 변수나 CLI --profile로 지정한 파일에
+한 줄에 한 번씩(JSON Lines) 추가
+"""
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import cancel
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "SCHOOL_GYM_PROFILE"
+
+STAGE_LABELS = {
+    "cache_read": "캐시 확인",
+    "csv_read": "CSV 읽기",
+    "headers": "시간 헤더 찾기",
+    "name_scan": "이름 스캔",
+    "merge": "구간 병합",
+    "calendar": "달력 날짜 계산",
+    "excel": "엑셀 저장",
+    "chart": "그래프 그리기",
+}
+
+# 처음 실행할 때의 단계별 예상 비중 - 이후에는 직전 실행에서 잰 시간을 사용
+DEFAULT_WEIGHTS = {
+    "csv_read": 3,
+    "headers": 1,
+    "name_scan": 4,
+    "merge": 1,
+    "calendar": 0.5,
+    "excel": 3,
+    "chart": 1,
+}
+
+_last_seconds = {}  # {단계: 직전 실행에서 걸린 시간}
+
+
+def stage(timer, name, items=None):
+    """timer가 없으면 아무것도 재지 않는 stage (roster/aggregate에서 사용)"""
+    if timer is None:
+        return nullcontext({})
+    return timer.stage(name, items)
+
+
+class StageTimer:
+    """단계별 시간 측정 + 진행률 계산
+
+    진행률은 단계별 예상 시간 비중으로 나누고, 단계 안에서는 advance(처리한 수,
+    전체 수)로 처리한 행/파일 수에 비례해 올라감
+    progress(0~100), status(문구)는 GUI 시그널이나 다이얼로그 메서드
+    token(cancel.CancelToken)이 있으면 단계 시작/advance마다 취소 여부 확인
+    """
+
+    def __init__(self, stages, progress=None, status=None, label="", token=None):
+        self.stages = list(stages)
+        self.progress = progress
+        self.status = status
+        self.label = label
+        self.token = token
+        self.records = []
+        self.started = time.perf_counter()
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+
+        # 모든 단계를 재 본 적이 있을 때만 실제 시간 사용 (단위가 섞이지 않게)
+        if all(_last_seconds.get(name) for name in self.stages):
+            weights = {name: _last_seconds[name] for name in self.stages}
+        else:
+            weights = {name: DEFAULT_WEIGHTS[name] for name in self.stages}
+        total = sum(weights.values()) or 1
+        self.shares = {}  # {단계: (시작 진행률, 비중)}
+        done = 0.0
+        for name in self.stages:
+            share = 100 * weights[name] / total
+            self.shares[name] = (done, share)
+            done += share
+
+        self.value = 0.0
+        self.current = None
+
+    @contextmanager
+    def stage(self, name, items=None):
+        """단계 하나 측정 - 넘겨받은 record["items"]에 처리한 수를 적을 수 있음"""
+        cancel.check(self.token)
+        if self.status:
+            self.status(f"{STAGE_LABELS[name]} 중...")
+        record = {"stage": name, "seconds": 0.0, "items": items}
+        self.current = name
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self.records.append(record)
+            self.current = None
+            # 여러 달/여러 명이면 같은 단계가 반복되므로 한 번 끝난 구간까지만 올림
+            begin, share = self.shares.get(name, (self.value, 0))
+            self.emit(begin + share)
+
+    def advance(self, done, total):
+        """현재 단계 안에서 처리한 행/파일 수만큼 진행률 반영 (total을 모르면 None)"""
+        cancel.check(self.token)
+        if self.current in self.shares and total:
+            begin, share = self.shares[self.current]
+            self.emit(begin + share * done / total)
+
+    def emit(self, value):
+        if value < self.value:
+            return
+        self.value = value
+        if self.progress:
+            self.progress(min(100, int(value)))
+
+    def summary(self):
+        """실행 요약 - 같은 단계는 합산 (여러 달/여러 명)"""
+        stages = {}
+        for record in self.records:
+            entry = stages.setdefault(
+                record["stage"],
+                {
+                    "stage": record["stage"],
+                    "label": STAGE_LABELS[record["stage"]],
+                    "seconds": 0.0,
+                    "items": 0,
+                    "calls": 0,
+                },
+            )
+            entry["seconds"] += record["seconds"]
+            entry["items"] += record["items"] or 0
+            entry["calls"] += 1
+
+        for entry in stages.values():
+            entry["seconds"] = round(entry["seconds"], 4)
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total_seconds": round(time.perf_counter() - self.started, 4),
+            "stages": list(stages.values()),
+        }
+
+    def finish(self, json_path=None):
+        """측정 종료 - 로그 요약, 다음 실행의 진행률 비중 갱신, JSON 기록"""
+        summary = self.summary()
+        for entry in summary["stages"]:
+            _last_seconds[entry["stage"]] = entry["seconds"]
+
+        logger.info(
+            "단계별 시간 (%s, 총 %.3fs): %s",
+            self.label,
+            summary["total_seconds"],
+            ", ".join(
+                f"{entry['label']} {entry['seconds']:.3f}s ({entry['items']})"
+                for entry in summary["stages"]
+            ),
+        )
+
+        json_path = json_path or os.environ.get(PROFILE_ENV)
+        if json_path:
+            try:
+                with open(json_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning("실행 시간 기록 실패: %s", e)
+        return summary
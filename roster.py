@@ -0,0 +1,647 @@
+"""
+근무표 파싱 엔진 - CSV를 한 번만 읽고 통계/그래프/엑셀이 같은 결과를 공유
+"""
+
+import csv
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime, date
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import profiler
+
+logger = logging.getLogger(__name__)
+
+# "09:00~10:00", "9:00 - 10:00" 같은 시간 범위 형식
+TIME_RANGE_PATTERN = r"\d{1,2}:\d{2}\s*[~-]\s*\d{1,2}:\d{2}"
+
+# 시간 범위에서 시/분 추출 (parse_time_range)
+TIME_RANGE_PARTS = re.compile(r"(\d{1,2}):(\d{2})\s*[~-]\s*(\d{1,2}):(\d{2})")
+
+# 이 크기 이상의 CSV는 DataFrame으로 읽지 않고 한 줄씩 스트리밍 파싱
+STREAM_MIN_BYTES = 20 * 1024 * 1024
+
+# 긴 스캔 중 진행률/취소 확인 간격 (행)
+PROGRESS_ROWS = 500
+
+# 벡터 연산 스캔을 나누는 행 수 - 너무 작으면 묶음마다 드는 pandas 고정 비용이 커짐
+SCAN_CHUNK_ROWS = 2000
+
+# 하루 = 1440분 (자정을 넘기는 근무 처리)
+MINUTES_PER_DAY = 24 * 60
+
+# 한 칸에 여러 명이 적힌 경우의 구분자 (예: "권혁준, 김철수")
+NAME_SEPARATOR = r"[,/\n]"
+
+WEEKDAY_KOR = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def read_roster(file_path):
+    """근무표 CSV 읽기 (헤더 없이 원본 그대로)"""
+    return pd.read_csv(file_path, header=None)
+
+
+def frame_from_rows(rows):
+    """구글 시트에서 받은 행 목록을 read_roster와 같은 모양의 DataFrame으로
+
+    CSV를 거치지 않으므로 빈 문자열을 결측값으로 바꿔 CSV를 읽었을 때와 맞춤
+    """
+    df = pd.DataFrame(rows)
+    return df.mask(df == "")
+
+
+def load_roster(source):
+    """CSV 파일 경로 또는 구글 시트 행 목록에서 근무표 DataFrame 생성"""
+    if isinstance(source, str):
+        return read_roster(source)
+    return frame_from_rows(source)
+
+
+def find_time_headers(df):
+    """1단계: 모든 시간 범위 헤더 찾기 - {행번호: {열번호: 시간범위}}
+
+    첫 두 열이 비어있는 행만 골라 시간 형식 셀을 한 번에 검사 (행 단위 반복 없음)
+    """
+    time_headers = {}
+    if df.shape[1] <= 2:
+        return time_headers
+
+    blank_ab = df[0].isna() & df[1].isna()
+    cells = df.loc[blank_ab, df.columns[2:]].stack().astype(str).str.strip()
+    cells = cells[cells.str.contains(TIME_RANGE_PATTERN, regex=True)]
+
+    for (idx, col_idx), cell_value in cells.items():
+        time_headers.setdefault(idx, {})[col_idx] = cell_value
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for idx, time_ranges in time_headers.items():
+            logger.debug("시간 헤더 발견 (행 %s): %s", idx, time_ranges)
+
+    return time_headers
+
+
+def locate_rows(df, time_headers):
+    """각 행이 속한 헤더 행과 날짜를 벡터 연산으로 계산
+
+    반환값: (헤더행번호 Series, 날짜 Series, 근무자 행 마스크)
+    """
+    header_mask = df.index.isin(list(time_headers))
+    header_row = pd.Series(
+        np.where(header_mask, df.index, np.nan), index=df.index
+    ).ffill()
+
+    # 첫 헤더 이전 행과 헤더 행 자체는 무시
+    in_block = header_row.notna() & ~header_mask
+
+    # 날짜가 있는 행: A열이 비어있지 않고 "일"이 포함된 행
+    date_cells = df[0].where(df[0].notna()).astype(str).str.strip()
+    is_date = in_block & df[0].notna() & date_cells.str.contains("일", regex=False)
+    # 마지막 날짜 행의 위치를 앞으로 채운 뒤 해당 날짜 문자열로 변환
+    date_pos = pd.Series(np.where(is_date, np.arange(len(df)), np.nan)).ffill()
+    date_pos = date_pos.where(in_block.to_numpy()).to_numpy()
+    has_date = ~np.isnan(date_pos)
+    date_values = np.full(len(df), None, dtype=object)
+    date_values[has_date] = date_cells.to_numpy()[date_pos[has_date].astype(int)]
+    current_date = pd.Series(date_values, index=df.index)
+
+    # 근무자 행: B열이 비어있지 않고 날짜가 정해진 행
+    worker_rows = in_block & df[1].notna() & current_date.notna()
+    return header_row, current_date, worker_rows
+
+
+def slot_cells(df, worker_rows):
+    """근무자 행의 시간 칸 셀을 (행, 열) 인덱스로 쌓은 Series
+
+    이름은 문자열 셀에만 있으므로 object 열만 쌓아서 한 번에 검색
+    """
+    text_cols = [c for c in df.columns[2:] if df[c].dtype == object]
+    return df.loc[worker_rows, text_cols].stack()
+
+
+def cell_positions(cells, header_row, current_date):
+    """쌓인 셀마다 (행, 열, 헤더행번호, 날짜, 값) 생성 - Series 개별 조회 없이 배열로"""
+    rows = cells.index.get_level_values(0)
+    cols = cells.index.get_level_values(1)
+    pos = header_row.index.get_indexer(rows)
+    header_rows = header_row.to_numpy()[pos]
+    dates = current_date.to_numpy()[pos]
+
+    for idx, col_idx, current_header_row, work_date, value in zip(
+        rows, cols, header_rows, dates, cells.to_numpy()
+    ):
+        yield int(idx), int(col_idx), int(current_header_row), work_date, value
+
+
+def collect_work_data(df, time_headers, target_name):
+    """2단계: 근무자 데이터 수집 - [(날짜, 시간범위, 헤더행번호)]"""
+    work_data = []
+    if not time_headers:
+        return work_data
+
+    header_row, current_date, worker_rows = locate_rows(df, time_headers)
+    cells = slot_cells(df, worker_rows)
+    matches = cells[cells.str.contains(target_name, regex=False, na=False)]
+
+    for idx, col_idx, current_header_row, work_date, _ in cell_positions(
+        matches, header_row, current_date
+    ):
+        time_range = time_headers[current_header_row].get(col_idx)
+        if time_range is None:
+            continue
+        work_data.append((work_date, time_range, current_header_row))
+        logger.debug(
+            "근무 데이터: %s, %s, 헤더%s", work_date, time_range, current_header_row
+        )
+
+    return work_data
+
+
+def scan_names(df, time_headers, located, rows=None):
+    """근무자 행의 이름 칸 - (행, 열, 헤더행번호, 날짜, 이름) 생성
+
+    located: locate_rows 결과, rows: 검사할 행 마스크 (없으면 전체)
+    한 셀에 여러 명이 적혀 있으면 NAME_SEPARATOR 기준으로 나누고, 이름 옆에
+    적은 시간 메모(예: "권혁준 09:00~09:30")는 빼고 이름만 남김
+    """
+    header_row, current_date, worker_rows = located
+    if rows is not None:
+        worker_rows = worker_rows & rows
+
+    names = slot_cells(df, worker_rows).str.split(NAME_SEPARATOR).explode()
+    names = names.str.replace(TIME_RANGE_PATTERN, "", regex=True).str.strip()
+    names = names[(names != "") & ~names.str.fullmatch(r"[\d\s.:~-]*", na=True)]
+
+    for idx, col_idx, current_header_row, work_date, name in cell_positions(
+        names, header_row, current_date
+    ):
+        if col_idx in time_headers[current_header_row]:
+            yield idx, col_idx, current_header_row, work_date, name
+
+
+def build_name_index(df, time_headers):
+    """이름 역색인 생성 - 시트를 한 번만 훑어서 모든 근무자의 근무 칸을 수집
+
+    반환값: {이름: [(날짜, 열번호, 헤더행번호, 행번호)]} (CSV 순서)
+    """
+    index = {}
+    if not time_headers:
+        return index
+
+    located = locate_rows(df, time_headers)
+    for idx, col_idx, header_row, work_date, name in scan_names(
+        df, time_headers, located
+    ):
+        index.setdefault(name, []).append((work_date, col_idx, header_row, idx))
+
+    return index
+
+
+def header_blocks(df, time_headers):
+    """헤더 블록 - [(시작행, 끝행)]: 시간 헤더 행부터 다음 헤더 행 직전까지"""
+    starts = sorted(time_headers)
+    return list(zip(starts, starts[1:] + [len(df)]))
+
+
+def block_fingerprint(row_hashes, current_date, start, stop):
+    """헤더 블록 내용 해시 - 행 해시와 각 행의 날짜 (앞 블록에서 이어진 날짜 포함)
+
+    row_hashes: 시트 전체를 한 번에 계산한 행별 해시 (행 번호는 넣지 않으므로
+    위쪽에 행이 추가돼 블록이 밀려도 같은 해시)
+    """
+    digest = hashlib.sha1(row_hashes[start:stop].tobytes())
+    digest.update(repr(current_date.iloc[start:stop].tolist()).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_block_index(df, time_headers, previous=None, progress=None):
+    """헤더 블록 단위 이름 역색인 - 내용이 바뀐 블록만 다시 파싱
+
+    previous: 이전 호출이 반환한 blocks (같은 해시의 블록은 그대로 재사용)
+    progress(처리한 행, 전체 행): 스캔하는 SCAN_CHUNK_ROWS행 묶음마다 호출 (취소 확인 지점)
+    blocks: {블록 해시: {이름: [(날짜, 열번호, 블록 내 행 위치)]}}
+    반환값: (build_name_index와 같은 역색인, blocks, 다시 파싱한 블록 수)
+    """
+    previous = previous or {}
+    index = {}
+    blocks = {}
+    if not time_headers:
+        return index, blocks, 0
+
+    located = locate_rows(df, time_headers)
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    block_keys = [
+        (start, stop, block_fingerprint(row_hashes, located[1], start, stop))
+        for start, stop in header_blocks(df, time_headers)
+    ]
+
+    # 바뀐 블록들만 SCAN_CHUNK_ROWS행씩 나눠 스캔 (묶음마다 진행률/취소 확인)
+    changed = {start: {} for start, _, key in block_keys if key not in previous}
+    if changed:
+        rows = np.zeros(len(df), dtype=bool)
+        for start, stop, key in block_keys:
+            if start in changed:
+                rows[start:stop] = True
+        for begin in range(0, len(df), SCAN_CHUNK_ROWS):
+            end = min(begin + SCAN_CHUNK_ROWS, len(df))
+            if rows[begin:end].any():
+                part = tuple(series.iloc[begin:end] for series in located)
+                for idx, col_idx, header_row, work_date, name in scan_names(
+                    df.iloc[begin:end], time_headers, part, rows[begin:end]
+                ):
+                    changed[header_row].setdefault(name, []).append(
+                        (work_date, col_idx, idx - header_row)
+                    )
+            if progress:
+                progress(end, len(df))
+
+    for start, stop, key in block_keys:
+        entries = changed.get(start)
+        if entries is None:
+            entries = previous[key]
+        blocks[key] = entries
+        for name, slots in entries.items():
+            index.setdefault(name, []).extend(
+                (work_date, col_idx, start, start + offset)
+                for work_date, col_idx, offset in slots
+            )
+
+    return index, blocks, len(changed)
+
+
+def lookup_work_data(index, time_headers, target_name):
+    """역색인에서 근무 데이터 조회 - 이름 하나를 입력하면 collect_work_data와 같은 결과
+
+    이름 일부만 입력해도 찾을 수 있도록 기존처럼 포함 여부로 비교
+    (칸 전체가 아니라 칸을 나눈 이름마다 비교하므로 구분자를 포함한 입력은 찾지 못함)
+    """
+    entries = set()
+    for name, slots in index.items():
+        if target_name in name:
+            entries.update(slots)
+
+    return [
+        (work_date, time_headers[header_row][col_idx], header_row)
+        for work_date, col_idx, header_row, idx in sorted(
+            entries, key=lambda entry: (entry[3], entry[1])
+        )
+    ]
+
+
+@lru_cache(maxsize=None)
+def parse_time_range(time_str):
+    """시간 범위 문자열을 자정 기준 분 단위 (시작, 끝)으로 파싱
+
+    같은 헤더 문자열이 매주 반복되므로 문자열마다 한 번만 계산
+    끝이 시작보다 이르면 자정을 넘긴 근무로 보고 끝에 하루(1440분)를 더함
+    시작과 끝이 같으면 (보통 오타나 빈 칸) 24시간이 아니라 0분 구간으로 봄
+    """
+    match = TIME_RANGE_PARTS.search(time_str)
+    if not match:
+        raise ValueError(f"시간 범위 형식이 아닙니다: {time_str}")
+    start_hour, start_min, end_hour, end_min = map(int, match.groups())
+    start = start_hour * 60 + start_min
+    end = end_hour * 60 + end_min
+    if end == start:
+        logger.warning("시작과 끝이 같은 시간 범위는 0분으로 계산: %s", time_str)
+    elif end < start:
+        end += MINUTES_PER_DAY
+    return start, end
+
+
+def merge_time_ranges(ranges):
+    """분 단위 구간들을 병합 (연속되거나 겹치는 시간은 하나로)
+
+    자정까지 이어지는 구간이 있으면 이어지는 근무의 끝 시각 이전에 시작하는 새벽
+    구간 (예: "23:00~00:00" 다음 "00:00~01:00", "01:00~02:00")은 하나씩 다음 날로
+    옮기면서 근무 끝 시각을 늘려 감
+    """
+    ranges = sorted((start, end) for start, end in ranges if end > start)  # 0분 제외
+    if not ranges:
+        return []
+
+    chain_end = max(end for _, end in ranges)
+    if chain_end >= MINUTES_PER_DAY:
+        rolled = []
+        for start, end in ranges:
+            if start <= chain_end - MINUTES_PER_DAY:
+                start, end = start + MINUTES_PER_DAY, end + MINUTES_PER_DAY
+                chain_end = max(chain_end, end)
+            rolled.append((start, end))
+        ranges = sorted(rolled)
+
+    merged = [ranges[0]]
+
+    for current_start, current_end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if current_start <= last_end:
+            merged[-1] = (last_start, max(last_end, current_end))
+        else:
+            merged.append((current_start, current_end))
+
+    return merged
+
+
+def format_minutes(minutes):
+    """자정 기준 분을 "HH:MM"으로 표시 (자정을 넘긴 시각은 다음 날 시각으로)"""
+    minutes %= MINUTES_PER_DAY
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def format_ranges(ranges):
+    """병합된 구간 표시 (예: "09:00-11:00,13:00-14:00")"""
+    return ",".join(
+        f"{format_minutes(start)}-{format_minutes(end)}" for start, end in ranges
+    )
+
+
+def merge_work_data(work_data):
+    """3단계: 날짜별로 그룹화 후 병합 - CSV에 나타난 순서 유지"""
+    date_work = {}  # {날짜: [(시작시간, 끝시간)]}
+    date_order = []  # CSV에서 나타난 순서대로
+
+    for work_date, time_range, header_row in work_data:
+        start, end = parse_time_range(time_range)
+        if end == start:
+            continue  # 0분 구간만 있는 날은 근무일로 세지 않음
+        if work_date not in date_work:
+            date_work[work_date] = []
+            date_order.append(work_date)
+        date_work[work_date].append((start, end))
+
+    merged = {d: merge_time_ranges(date_work[d]) for d in date_order}
+    return date_order, merged
+
+
+def resolve_dates(date_order, month_range, year=None):
+    """4단계: "N일" 문자열을 실제 달력 날짜로 변환 (예: month_range="8-9")
+
+    year: 시작 월의 연도 (없으면 올해)
+    """
+    start_month = int(month_range.split("-")[0])
+    next_month = int(month_range.split("-")[1])
+    start_year = year or datetime.now().year
+
+    dates = {}
+    prev_day = 0
+    is_next_month = False  # 다음 월로 넘어갔는지 추적
+
+    for d_str in date_order:
+        day_int = int(re.sub(r"\D", "", d_str))
+
+        # 날짜가 작아지면 다음 월로 넘어간 것
+        if prev_day and day_int < prev_day:
+            is_next_month = True
+        prev_day = day_int
+
+        if is_next_month:
+            current_month = next_month
+            current_year = start_year
+            # 다음 월이 1월이면 연도 증가
+            if current_month == 1 and start_month == 12:
+                current_year += 1
+        else:
+            current_month = start_month
+            current_year = start_year
+
+        dates[d_str] = date(current_year, current_month, day_int)
+
+    return dates
+
+
+def parse_roster(df, target_name, month_range, year=None):
+    """근무표 전체 파싱 - 통계/그래프/엑셀이 공유하는 중간 결과 반환
+
+    반환값 (근무 데이터가 없으면 None):
+        name: 근무자 이름
+        month_range: 근무 월 (예: "8-9")
+        date_order: CSV에 나타난 순서의 날짜 문자열 목록
+        merged: {날짜: [(시작, 끝)]} 병합된 근무 구간 (자정 기준 분)
+        dates: {날짜: datetime.date} 실제 달력 날짜
+    """
+    time_headers = find_time_headers(df)
+    work_data = collect_work_data(df, time_headers, target_name)
+    if not work_data:
+        return None
+    return build_parsed(work_data, target_name, month_range, year)
+
+
+def build_parsed(work_data, target_name, month_range, year=None, timer=None):
+    """수집된 근무 데이터로 중간 결과 생성 (timer: profiler.StageTimer)"""
+    with profiler.stage(timer, "merge", len(work_data)):
+        date_order, merged = merge_work_data(work_data)
+    with profiler.stage(timer, "calendar", len(date_order)):
+        dates = resolve_dates(date_order, month_range, year)
+    return {
+        "name": target_name,
+        "month_range": month_range,
+        "date_order": date_order,
+        "merged": merged,
+        "dates": dates,
+    }
+
+
+def iter_csv_rows(file_path, digest=None):
+    """CSV를 한 줄씩 읽기 - read_csv처럼 빈 줄은 건너뛰고 BOM 제거
+
+    digest(hashlib 객체)가 있으면 읽은 바이트를 그대로 넣음 (파일을 다시 읽지 않고
+    내용 해시 계산)
+    """
+    with open(file_path, "rb") as f:
+        for row in csv.reader(decoded_lines(f, digest)):
+            if row:
+                yield row
+
+
+def decoded_lines(f, digest=None):
+    """바이너리 파일의 줄을 utf-8 문자열로 (첫 줄의 BOM 제거, 줄바꿈 문자는 유지)"""
+    encoding = "utf-8-sig"
+    for line in f:
+        if digest is not None:
+            digest.update(line)
+        yield line.decode(encoding)
+        encoding = "utf-8"
+
+
+def stream_cells(rows, time_headers):
+    """상태 기계로 근무 칸 생성 - (행번호, 열번호, 헤더행번호, 날짜, 셀값)
+
+    상태: 현재 시간 헤더, 현재 날짜. 행을 하나씩만 보므로 메모리는 파일
+    크기와 무관하고, 발견한 시간 헤더는 time_headers에 채워 넣음
+    (find_time_headers/locate_rows와 같은 규칙)
+    """
+    header_row = None
+    header = None
+    current_date = None
+
+    for idx, row in enumerate(rows):
+        first = row[0] if row else ""
+        second = row[1] if len(row) > 1 else ""
+
+        # 첫 두 칸이 비어있고 시간 형식 칸이 있으면 새 시간 헤더
+        if not first and not second:
+            found = {
+                col_idx: value.strip()
+                for col_idx, value in enumerate(row[2:], start=2)
+                if value and re.search(TIME_RANGE_PATTERN, value.strip())
+            }
+            if found:
+                header_row, header = idx, found
+                time_headers[idx] = found
+                continue
+
+        if header is None:
+            continue  # 첫 헤더 이전 행은 무시
+
+        if first and "일" in first.strip():
+            current_date = first.strip()
+        if not second or current_date is None:
+            continue
+
+        for col_idx in header:
+            if col_idx < len(row) and row[col_idx]:
+                yield idx, col_idx, header_row, current_date, row[col_idx]
+
+
+def stream_name_index(file_path, progress=None, digest=None):
+    """스트리밍으로 이름 역색인 생성 - (time_headers, build_name_index 결과)
+
+    progress(처리한 행, None): PROGRESS_ROWS행마다 호출 (전체 행 수는 모름)
+    digest: 읽은 바이트를 넣을 hashlib 객체 (iter_csv_rows)
+    """
+    time_headers = {}
+    index = {}
+    not_name = re.compile(r"[\d\s.:~-]*")
+    next_report = PROGRESS_ROWS
+    for idx, col_idx, header_row, work_date, value in stream_cells(
+        iter_csv_rows(file_path, digest), time_headers
+    ):
+        if progress and idx >= next_report:
+            progress(idx, None)
+            next_report = idx + PROGRESS_ROWS
+        for name in re.split(NAME_SEPARATOR, value):
+            name = re.sub(TIME_RANGE_PATTERN, "", name).strip()
+            if not name or not_name.fullmatch(name):
+                continue
+            index.setdefault(name, []).append((work_date, col_idx, header_row, idx))
+    return time_headers, index
+
+
+def is_large_csv(source):
+    """스트리밍 파싱 대상인 큰 CSV 파일인지"""
+    return isinstance(source, str) and os.path.getsize(source) >= STREAM_MIN_BYTES
+
+
+def sheet_years(month_ranges, start_year=None):
+    """연속된 근무 월 목록의 시작 연도 - "12-1" 다음 "1-2"처럼 해가 바뀌면 +1"""
+    year = start_year or datetime.now().year
+    years = []
+    prev_month = None
+    for month_range in month_ranges:
+        start_month = int(month_range.split("-")[0])
+        if prev_month is not None and start_month < prev_month:
+            year += 1
+        years.append(year)
+        prev_month = start_month
+    return years
+
+
+def combine_parsed(parsed_list):
+    """여러 달의 중간 결과를 실제 날짜 기준으로 합치기 (같은 날짜는 구간 병합)
+
+    날짜 문자열은 달이 달라도 겹치므로 합친 결과는 "8월 26일" 형식을 사용
+    (한 달뿐이면 그대로 반환)
+    """
+    if len(parsed_list) == 1:
+        return parsed_list[0]
+
+    by_date = {}
+    for parsed in parsed_list:
+        for work_date in parsed["date_order"]:
+            real_date = parsed["dates"][work_date]
+            by_date.setdefault(real_date, []).extend(parsed["merged"][work_date])
+
+    date_order = []
+    merged = {}
+    dates = {}
+    for real_date in sorted(by_date):
+        key = f"{real_date.month}월 {real_date.day}일"
+        date_order.append(key)
+        merged[key] = merge_time_ranges(by_date[real_date])
+        dates[key] = real_date
+
+    month_ranges = [parsed["month_range"] for parsed in parsed_list]
+    return {
+        "name": parsed_list[0]["name"],
+        "month_range": month_range_label(month_ranges),
+        "date_order": date_order,
+        "merged": merged,
+        "dates": dates,
+    }
+
+
+def month_range_label(month_ranges):
+    """여러 달 범위 표시 (예: ["8-9", "9-10"] → "8-9~9-10")"""
+    if len(month_ranges) == 1:
+        return month_ranges[0]
+    return f"{month_ranges[0]}~{month_ranges[-1]}"
+
+
+def day_minutes(ranges):
+    """병합된 구간들의 총 근무 분"""
+    return sum(end - start for start, end in ranges)
+
+
+def build_stats(parsed):
+    """중간 결과로 통계 생성 (그래프도 이 결과를 사용)"""
+    day_list = []
+    hours_list = []
+    day_labels = []
+    total_minutes = 0
+
+    for work_date in parsed["date_order"]:
+        minutes = day_minutes(parsed["merged"][work_date])
+        total_minutes += minutes
+        day_list.append(work_date)
+        hours_list.append(round(minutes / 60, 2))
+
+        weekday = WEEKDAY_KOR[parsed["dates"][work_date].weekday()]
+        day_labels.append(f"{work_date} ({weekday})")
+        logger.debug("%s: %.2f시간", work_date, minutes / 60)
+
+    days = len(day_list)
+    total_hours = total_minutes / 60
+    avg_hours = total_hours / days if days else 0
+
+    logger.debug("%s 총 근무시간: %.2f시간", parsed["name"], total_hours)
+
+    return {
+        "days": days,
+        "total_hours": total_hours,
+        "avg_hours": avg_hours,
+        "day_list": day_list,
+        "hours_list": hours_list,
+        "day_labels": day_labels,
+        "parsed": parsed,
+    }
+
+
+def build_excel_records(parsed):
+    """중간 결과로 엑셀 행 생성 - 월/일/요일/근무시간"""
+    records = []
+    for work_date in parsed["date_order"]:
+        real_date = parsed["dates"][work_date]
+        merged_times_str = format_ranges(parsed["merged"][work_date])
+        records.append(
+            {
+                "월": real_date.month,
+                "일": real_date.day,
+                "요일": WEEKDAY_KOR[real_date.weekday()] + "요일",
+                "근무시간": merged_times_str,
+            }
+        )
+    return records
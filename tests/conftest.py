@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# 저장소 최상위 모듈(gui, roster, ...)을 바로 불러옴
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 화면 없이 Qt 위젯 실행
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROSTER_CSV = """\
+월간 근무표,,,,
+,,09:00~10:00,10:00~11:00,11:00~12:00
+26일,오전,김철수,권혁준,권혁준
+,오후,권혁준,김철수,
+27일,오전,,권혁준,김철수
+,오후,김철수,,권혁준
+"""
+
+
+@pytest.fixture
+def roster_csv(tmp_path, monkeypatch):
+    """작은 근무표 CSV (스캔 캐시는 임시 폴더에 저장)"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    path = tmp_path / "roster.csv"
+    path.write_text(ROSTER_CSV, encoding="utf-8-sig")
+    return str(path)
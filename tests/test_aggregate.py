@@ -0,0 +1,73 @@
+import builtins
+import os
+
+import pytest
+
+import aggregate
+import profiler
+import roster
+
+
+@pytest.fixture
+def csv_opens(monkeypatch):
+    """열린 파일 경로 기록"""
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    return opened
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_disk_cache_reads_csv_once(
+    stream, roster_csv, tmp_path, csv_opens, monkeypatch
+):
+    """디스크 캐시를 써도 CSV는 파싱할 때 한 번만 읽고, 다시 켜면 읽지 않음"""
+    if stream:
+        monkeypatch.setattr(roster, "STREAM_MIN_BYTES", 0)
+    (tmp_path / "rosters").mkdir()
+    disk = aggregate.RosterDiskCache(str(tmp_path / "rosters"))
+
+    def scan():
+        timer = profiler.StageTimer(["csv_read", "headers", "name_scan"])
+        del csv_opens[:]
+        scanned = aggregate.MonthCache(disk=disk).month("8-9", roster_csv, timer=timer)
+        stages = [record["stage"] for record in timer.records]
+        return scanned, csv_opens.count(roster_csv), stages
+
+    first, reads, stages = scan()
+    assert reads == 1
+    assert "name_scan" in stages
+
+    # 프로그램을 다시 켠 경우: 수정시각/크기로 찾으므로 파일을 읽지 않음
+    again, reads, stages = scan()
+    assert (reads, stages) == (0, ["cache_read"])
+    assert again["index"] == first["index"]
+
+    # 내용은 같고 수정시각만 바뀐 경우
+    stat = os.stat(roster_csv)
+    os.utime(roster_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _, reads, stages = scan()
+    assert reads == 1
+    if not stream:
+        assert stages == ["cache_read"]
+
+
+def test_disk_cache_reads_changed_csv_once(roster_csv, tmp_path, csv_opens):
+    """메모리에 이전 결과가 있는 파일이 바뀌어도 다시 파싱할 때 한 번만 읽음"""
+    (tmp_path / "rosters").mkdir()
+    cache = aggregate.MonthCache(
+        disk=aggregate.RosterDiskCache(str(tmp_path / "rosters"))
+    )
+    cache.month("8-9", roster_csv)
+    with open(roster_csv, "a", encoding="utf-8") as f:
+        f.write("28일,오전,권혁준,,\n")
+
+    del csv_opens[:]
+    scanned = cache.month("8-9", roster_csv)
+    assert csv_opens.count(roster_csv) == 1
+    assert scanned["rescanned"] == 1
@@ -0,0 +1,24 @@
+import os
+
+import aggregate
+import gsheet
+
+
+def test_roster_cache_round_trip_and_eviction(tmp_path):
+    cache = aggregate.RosterDiskCache(str(tmp_path), max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {0: {2: "09:00~10:00"}}, {key: []}, {})
+
+    assert sorted(os.listdir(tmp_path)) == ["b.pickle", "c.pickle"]
+    assert cache.get("a") is None
+    assert cache.get("c")["index"] == {"c": []}
+
+
+def test_worksheet_cache_ignores_broken_files(tmp_path):
+    cache = gsheet.WorksheetCache(str(tmp_path))
+    cache.put("sheet", "8-9", [["a", "b"]], revision="r1")
+    assert cache.get("sheet", "8-9")["values"] == [["a", "b"]]
+
+    with open(cache.path_for(cache.key_for("sheet", "8-9")), "w") as f:
+        f.write("{")
+    assert cache.get("sheet", "8-9") is None
@@ -0,0 +1,55 @@
+import os
+import time
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# 테스트 환경에는 한글 글꼴이 없음
+pytestmark = pytest.mark.filterwarnings("ignore:Glyph")
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def wait_until(app, condition, timeout=20):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def test_single_name_flow(app, roster_csv, tmp_path, monkeypatch):
+    """엑셀로 저장 및 통계 보기 - 처리 완료 후 진행 다이얼로그를 닫아도 취소되지 않음"""
+    import gui
+
+    messages = []
+    for kind in ("information", "warning", "critical"):
+        monkeypatch.setattr(
+            gui.QMessageBox,
+            kind,
+            staticmethod(lambda *args, kind=kind: messages.append((kind, args[2]))),
+        )
+    monkeypatch.chdir(tmp_path)
+
+    window = gui.ScheduleApp()
+    window.name_input.setText("권혁준")
+    window.month_combo.setCurrentText("8-9")
+    window.file_path.setText(roster_csv)
+    window.on_run_btn_clicked()
+
+    wait_until(app, lambda: window.stacked.currentIndex() == 1 or messages)
+    window.export_pool.waitForDone()
+    wait_until(app, lambda: window.pending_exports == 0)
+
+    assert messages == []
+    assert window.stacked.currentIndex() == 1
+    assert not window.data_worker.token.is_cancelled
+    stats = window.last_stats[0]
+    assert stats["days"] == 2
+    assert stats["total_hours"] == pytest.approx(5)
+    assert os.path.exists(tmp_path / "권혁준_8-9.xlsx")
+    window.close()
@@ -0,0 +1,131 @@
+import csv
+
+import pytest
+
+import roster
+
+# 한 칸에 시간 메모나 여러 이름이 적힌 근무표
+ANNOTATED_ROWS = [
+    ["", "", "09:00~10:00", "10:00~11:00", "11:00~12:00"],
+    ["1일", "오전", "권혁준 09:00~09:30", "김철수, 권혁준", "김철수/최지우"],
+    ["", "오후", "최지우\n권혁준", "", "09:00~09:30"],
+    ["2일", "오전", "김철수", "권혁준(대타)", "혁준 10:00-10:30"],
+]
+
+
+def test_block_index_reports_progress_per_chunk(roster_csv, monkeypatch):
+    """바뀐 블록 스캔을 묶음으로 나눠도 한 번에 스캔한 역색인과 같음"""
+    monkeypatch.setattr(roster, "SCAN_CHUNK_ROWS", 2)
+    df = roster.load_roster(roster_csv)
+    time_headers = roster.find_time_headers(df)
+
+    calls = []
+    index, _, rescanned = roster.build_block_index(
+        df, time_headers, progress=lambda done, total: calls.append((done, total))
+    )
+
+    assert rescanned == 1
+    assert calls == [(2, len(df)), (4, len(df)), (len(df), len(df))]
+    assert {name: sorted(slots) for name, slots in index.items()} == {
+        name: sorted(slots)
+        for name, slots in roster.build_name_index(df, time_headers).items()
+    }
+
+
+def test_block_index_cancels_between_chunks(roster_csv, monkeypatch):
+    """취소하면 남은 묶음을 스캔하지 않고 바로 멈춤"""
+    import cancel
+    import profiler
+
+    monkeypatch.setattr(roster, "SCAN_CHUNK_ROWS", 2)
+    df = roster.load_roster(roster_csv)
+    time_headers = roster.find_time_headers(df)
+    token = cancel.CancelToken()
+    timer = profiler.StageTimer(["name_scan"], token=token)
+
+    scanned = []
+
+    def progress(done, total):
+        scanned.append(done)
+        token.cancel()
+        timer.advance(done, total)
+
+    with pytest.raises(cancel.Cancelled):
+        roster.build_block_index(df, time_headers, progress=progress)
+    assert scanned == [2]
+
+
+@pytest.mark.parametrize(
+    "time_str, expected",
+    [
+        ("09:00~10:30", (540, 630)),
+        ("12:00 - 13:00", (720, 780)),
+        ("23:00~01:00", (1380, 1500)),
+        ("23:00~00:00", (1380, 1440)),
+        ("09:00~09:00", (540, 540)),
+    ],
+)
+def test_parse_time_range(time_str, expected):
+    assert roster.parse_time_range(time_str) == expected
+
+
+def test_equal_time_range_counts_as_no_work():
+    """시작과 끝이 같은 칸은 24시간 근무가 아니라 없는 근무로 처리"""
+    date_order, merged = roster.merge_work_data(
+        [
+            ("1일", "09:00~10:00", 0),
+            ("1일", "10:00~10:00", 0),
+            ("2일", "13:00~13:00", 0),
+        ]
+    )
+    assert date_order == ["1일"]
+    assert merged == {"1일": [(540, 600)]}
+    assert roster.merge_time_ranges([(600, 600)]) == []
+
+
+@pytest.mark.parametrize("target", ["권혁준", "혁준", "김철수", "최지우"])
+def test_lookup_matches_collect_on_annotated_cells(target):
+    """역색인 조회도 시간 메모가 붙은 칸과 여러 명이 적힌 칸을 찾음"""
+    df = roster.frame_from_rows(ANNOTATED_ROWS)
+    time_headers = roster.find_time_headers(df)
+    index = roster.build_name_index(df, time_headers)
+
+    expected = roster.collect_work_data(df, time_headers, target)
+    assert expected
+    assert roster.lookup_work_data(index, time_headers, target) == expected
+
+
+@pytest.mark.parametrize(
+    "time_strs, expected",
+    [
+        (["09:00~10:00", "10:00~11:00", "13:00~14:00"], "09:00-11:00,13:00-14:00"),
+        (["23:00~00:00", "00:00~01:00"], "23:00-01:00"),
+        (["23:00~00:00", "00:00~01:00", "01:00~02:00"], "23:00-02:00"),
+        (
+            ["22:00~23:00", "23:00~00:00", "00:00~01:00", "01:00~02:00", "02:00~03:00"],
+            "22:00-03:00",
+        ),
+        (["01:00~02:00", "00:00~01:00", "23:00~00:00"], "23:00-02:00"),
+        (["09:00~10:00", "23:00~01:00", "01:00~02:00"], "09:00-10:00,23:00-02:00"),
+    ],
+)
+def test_merge_overnight_chain(time_strs, expected):
+    """자정을 넘긴 근무는 새벽 구간이 여러 개여도 한 구간으로 이어짐"""
+    merged = roster.merge_time_ranges([roster.parse_time_range(t) for t in time_strs])
+    assert roster.format_ranges(merged) == expected
+
+
+@pytest.mark.parametrize("rows", ["fixture", "annotated"])
+def test_stream_name_index_matches_build_name_index(rows, roster_csv, tmp_path):
+    """큰 CSV용 스트리밍 스캔도 DataFrame 스캔과 같은 시간 헤더/역색인"""
+    path = roster_csv
+    if rows == "annotated":
+        path = str(tmp_path / "annotated.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(ANNOTATED_ROWS)
+
+    df = roster.load_roster(path)
+    time_headers = roster.find_time_headers(df)
+    expected = roster.build_name_index(df, time_headers)
+
+    assert roster.stream_name_index(path) == (time_headers, expected)
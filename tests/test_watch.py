@@ -0,0 +1,38 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import watch
+
+
+class IdleSource:
+    """변경을 알리지 않는 감시 소스"""
+
+    def changes(self, timeout):
+        return []
+
+    def close(self):
+        pass
+
+
+def test_regenerate_recovers_from_broken_pool(roster_csv, tmp_path):
+    """저장 프로세스가 죽어도 풀을 다시 만들어 계속 엑셀을 생성"""
+    path = str(tmp_path / "근무표_8-9.csv")
+    os.replace(roster_csv, path)
+    watcher = watch.Watcher(
+        str(tmp_path), out_dir=str(tmp_path / "out"), jobs=1, source=IdleSource()
+    )
+    try:
+        with pytest.raises(BrokenProcessPool):
+            watcher.pool.submit(os._exit, 1).result()
+
+        saved = watcher.regenerate(path)
+
+        assert sorted(os.path.basename(name) for name in saved) == [
+            "권혁준_8-9.xlsx",
+            "김철수_8-9.xlsx",
+        ]
+        assert all(os.path.exists(name) for name in saved)
+    finally:
+        watcher.close()
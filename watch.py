@@ -0,0 +1,216 @@
+"""
+감시 폴더 - 근무표 CSV가 새로 들어오거나 바뀌면 전체 근무자 엑셀을 다시 생성
+
+리눅스는 inotify(ctypes), 그 외 환경은 주기적으로 폴더를 훑는 방식 사용
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import re
+import select
+import struct
+import sys
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import aggregate
+import export
+
+logger = logging.getLogger(__name__)
+
+# 파일 이름의 근무 월 (예: "근무표_8-9.csv" → "8-9")
+MONTH_IN_NAME = re.compile(r"(?<!\d)(\d{1,2})-(\d{1,2})(?!\d)")
+
+# 저장이 연달아 일어나면 마지막 변경 후 이 시간(초)이 지나야 한 번 처리
+DEBOUNCE_SECONDS = 1.0
+
+# 폴더를 훑는 주기 (polling 방식)
+POLL_INTERVAL = 1.0
+
+# inotify 상수 (<sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def is_roster_file(name):
+    """감시 대상 파일 - 숨김/임시 파일이 아닌 CSV"""
+    return name.lower().endswith(".csv") and not name.startswith((".", "~$"))
+
+
+def month_for(path, default=None):
+    """파일 이름에서 근무 월 추출 (없으면 default)"""
+    for match in MONTH_IN_NAME.finditer(os.path.basename(path)):
+        start_month, next_month = int(match.group(1)), int(match.group(2))
+        if 1 <= start_month <= 12 and next_month == start_month % 12 + 1:
+            return f"{start_month}-{next_month}"
+    return default
+
+
+class InotifySource:
+    """inotify로 폴더 변경 감지 - 쓰기가 끝났거나 옮겨진 파일 이름을 전달"""
+
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        wd = libc.inotify_add_watch(
+            self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch 실패: {directory}")
+
+    def changes(self, timeout):
+        """timeout(초) 동안 기다린 뒤 바뀐 파일 이름 목록"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self.fd, 64 * 1024)
+        names = []
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.append(os.fsdecode(name))
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingSource:
+    """폴더를 주기적으로 훑어 수정 시각/크기가 바뀐 파일 이름을 전달"""
+
+    def __init__(self, directory, interval=POLL_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        snapshot = self.scan()
+        names = [
+            name for name, state in snapshot.items() if self.snapshot.get(name) != state
+        ]
+        self.snapshot = snapshot
+        return names
+
+    def close(self):
+        pass
+
+
+def open_source(directory, polling=False, interval=POLL_INTERVAL):
+    """변경 감지 방식 선택 - 리눅스는 inotify, 실패하거나 다른 OS면 polling"""
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifySource(directory)
+        except (OSError, AttributeError, TypeError) as e:
+            logger.warning("inotify 사용 불가, 폴더 훑기로 감시합니다: %s", e)
+    return PollingSource(directory, interval)
+
+
+class Watcher:
+    """감시 폴더 처리기 - 변경 묶음(debounce)마다 해당 CSV의 전체 근무자 엑셀 생성"""
+
+    def __init__(
+        self,
+        directory,
+        month_range=None,
+        out_dir=None,
+        jobs=None,
+        debounce=DEBOUNCE_SECONDS,
+        source=None,
+    ):
+        self.directory = directory
+        self.month_range = month_range
+        self.out_dir = directory if out_dir is None else out_dir
+        self.debounce = debounce
+        self.source = source or open_source(directory)
+        # 엑셀 저장 프로세스 풀은 감시하는 동안 계속 재사용
+        self.jobs = jobs
+        self.pool = export.export_pool(jobs)
+        self.pending = {}  # {파일 경로: 처리할 시각}
+
+    def note(self, names):
+        """바뀐 파일 기록 - 같은 파일이 또 바뀌면 처리 시각을 뒤로 미룸"""
+        deadline = time.monotonic() + self.debounce
+        for name in names:
+            if is_roster_file(name):
+                self.pending[os.path.join(self.directory, name)] = deadline
+
+    def due(self):
+        """처리할 시각이 지난 파일 경로 목록 (대기 목록에서 제거)"""
+        now = time.monotonic()
+        ready = [path for path, deadline in self.pending.items() if deadline <= now]
+        for path in ready:
+            del self.pending[path]
+        return ready
+
+    def regenerate(self, path):
+        """CSV 하나의 전체 근무자 엑셀 다시 생성 - 저장된 파일 경로 목록 반환"""
+        month_range = month_for(path, self.month_range)
+        if month_range is None:
+            logger.warning(
+                "근무 월을 알 수 없어 건너뜀 (파일 이름에 8-9처럼 표기): %s", path
+            )
+            return []
+        if not os.path.exists(path):
+            return []
+
+        # 같은 파일을 다시 읽으면 바뀐 헤더 블록만 다시 파싱 (aggregate.MonthCache)
+        parsed_by_name = aggregate.parse_all_sheets({month_range: path})
+        try:
+            return export.save_all(parsed_by_name, self.out_dir, pool=self.pool)
+        except BrokenProcessPool:
+            # 하위 프로세스가 죽으면(메모리 부족, 강제 종료 등) 풀을 다시 쓸 수 없음
+            logger.warning("엑셀 저장 프로세스가 중단되어 풀을 다시 만듭니다")
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = export.export_pool(self.jobs)
+            return export.save_all(parsed_by_name, self.out_dir, pool=self.pool)
+
+    def timeout(self):
+        """다음 처리 시각까지 남은 시간 (대기 중인 파일이 없으면 감시 주기)"""
+        if not self.pending:
+            return POLL_INTERVAL
+        return max(0.0, min(self.pending.values()) - time.monotonic())
+
+    def run(self, stop=None):
+        """감시 반복 - stop(threading.Event)이 설정되면 종료"""
+        try:
+            while stop is None or not stop.is_set():
+                self.note(self.source.changes(self.timeout()))
+                for path in self.due():
+                    try:
+                        saved = self.regenerate(path)
+                    except Exception:
+                        logger.exception("처리 실패: %s", path)
+                        continue
+                    if saved:
+                        logger.info(
+                            "%s: %d명 엑셀 생성", os.path.basename(path), len(saved)
+                        )
+        finally:
+            self.close()
+
+    def close(self):
+        self.source.close()
+        self.pool.shutdown(wait=True)